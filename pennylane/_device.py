@@ -72,6 +72,7 @@ class Device(abc.ABC):
         self._wires = Wires(wires)
         self.num_wires = len(self._wires)
         self._wire_map = self.define_wire_map(self._wires)
+        self._mapped_wires = {}  #: dict[Wires->Wires]: cache of the wires mapped by map_wires
         self._op_queue = None
         self._obs_queue = None
         self._parameters = None
@@ -206,6 +207,13 @@ class Device(abc.ABC):
         Returns:
             Wires: wires with new labels
         """
+        # The same wires are typically mapped repeatedly, for every operation
+        # applied and every execution, so the results are cached.
+        mapped_wires = self._mapped_wires.get(wires, None)
+
+        if mapped_wires is not None:
+            return mapped_wires
+
         try:
             mapped_wires = wires.map(self.wire_map)
         except WireError:
@@ -215,6 +223,7 @@ class Device(abc.ABC):
                 )
             )
 
+        self._mapped_wires[wires] = mapped_wires
         return mapped_wires
 
     @classmethod
@@ -155,6 +155,10 @@ class QubitDevice(Device):
         Args:
             circuit (~.CircuitGraph): circuit to execute on the device
 
+        Keyword Args:
+            circuit_hash (int or None): The hash of the circuit, stored in :attr:`circuit_hash`.
+                If not provided, the hash is computed via ``circuit.hash``.
+
         Raises:
             QuantumFunctionError: if the value of :attr:`~.Observable.return_type` is not supported
 
@@ -163,7 +167,11 @@ class QubitDevice(Device):
         """
         self.check_validity(circuit.operations, circuit.observables)
 
-        self._circuit_hash = circuit.hash
+        if "circuit_hash" in kwargs:
+            # the caller may provide the hash, to avoid computing it if not required
+            self._circuit_hash = kwargs.pop("circuit_hash")
+        else:
+            self._circuit_hash = circuit.hash
 
         # apply all circuit operations
         self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
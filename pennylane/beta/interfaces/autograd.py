@@ -91,12 +91,7 @@ class AutogradInterface(AnnotatedQueue):
         private attribute there. This allows the :meth:`~.get_parameters` method to avoid performing
         a redundant parameter extraction.
         """
-        params = []
-
-        for p_idx in self._par_info:
-            op = self._par_info[p_idx]["op"]
-            op_idx = self._par_info[p_idx]["p_idx"]
-            params.append(op.data[op_idx])
+        params = [op.data[i] for op, i in zip(self._par_ops, self._par_p_idx.tolist())]
 
         trainable_params = set()
 
@@ -17,6 +17,8 @@ This module contains the functions for computing different types of measurement
 outcomes from quantum observables - expectation values, variances of expectations,
 and measurement samples using AnnotatedQueues.
 """
+import copy
+
 import numpy as np
 
 import pennylane as qml
@@ -46,6 +48,18 @@ class MeasurementProcess:
 
     # pylint: disable=too-few-public-methods
 
+    __slots__ = (
+        "return_type",
+        "obs",
+        "_wires",
+        "_eigvals",
+        "name",
+        "diagonalizing_gates",
+        "data",
+        "queue_idx",
+        "__weakref__",
+    )
+
     def __init__(self, return_type, obs=None, wires=None, eigvals=None):
         self.return_type = return_type
         self.obs = obs
@@ -79,6 +93,19 @@ class MeasurementProcess:
         # Queue the measurement process
         self.queue()
 
+    def __copy__(self):
+        cls = self.__class__
+        copied_m = cls.__new__(cls)
+
+        for attr in self.__slots__:
+            if attr != "__weakref__" and hasattr(self, attr):
+                setattr(copied_m, attr, getattr(self, attr))
+
+        if self.obs is not None:
+            copied_m.obs = copy.copy(self.obs)
+
+        return copied_m
+
     @property
     def wires(self):
         r"""The wires the measurement process acts on."""
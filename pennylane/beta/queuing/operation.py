@@ -141,7 +141,9 @@ def mock_operations():
     """
     # Monkeypatch the 'expand' method of operations directly.
     # This is required since it does not already exist, and so can't be mocked.
-    qml.operation.Operation.expand = operation_expand
+    # It is only set once, so that it may subsequently be wrapped (for example, by spies).
+    if not hasattr(qml.operation.Operation, "expand"):
+        qml.operation.Operation.expand = operation_expand
 
     mocks = []
 
@@ -15,10 +15,31 @@
 This module contains the :class:`QueuingContext` abstract base class.
 """
 import abc
-from collections import OrderedDict, deque
+from collections import deque
+import threading
 
 
-class QueuingContext(abc.ABC):
+class _ContextStack(threading.local):
+    """Stack of the queuing contexts that are currently active, local to each thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.contexts = deque()
+
+
+_STACK = _ContextStack()
+
+
+class _QueuingContextMeta(abc.ABCMeta):
+    """Metaclass exposing the active contexts of the current thread as a class attribute."""
+
+    @property
+    def _active_contexts(cls):
+        """deque: the stack of contexts that are currently active in this thread"""
+        return _STACK.contexts
+
+
+class QueuingContext(metaclass=_QueuingContextMeta):
     """Abstract base class for classes that exposes a queue for objects.
 
     This class provides a context manager that tracks queuable objects and queuing functions.
@@ -102,24 +123,24 @@ class QueuingContext(abc.ABC):
     [<__main__.QueuableQueue object at 0x7f94c432b6d0>, 'second object']
     >>> print(q1.queue[0].queue)
     ['first object']
-    """
 
-    _active_contexts = deque()
-    """The stack of contexts that are currently active."""
+    Active queuing contexts are tracked separately for each thread; objects are
+    only queued to a context entered within the same thread.
+    """
 
     def __enter__(self):
-        """Adds this instance to the global list of active contexts.
+        """Adds this instance to the list of active contexts of the current thread.
 
         Returns:
             QueuingContext: this instance
         """
-        QueuingContext._active_contexts.append(self)
+        _STACK.contexts.append(self)
 
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        """Remove this instance from the global list of active contexts."""
-        QueuingContext._active_contexts.pop()
+        """Remove this instance from the list of active contexts of the current thread."""
+        _STACK.contexts.pop()
 
     @abc.abstractmethod
     def _append(self, obj, **kwargs):
@@ -132,13 +153,18 @@ class QueuingContext(abc.ABC):
     @classmethod
     def recording(cls):
         """Whether a queuing context is active and recording operations"""
-        return bool(cls._active_contexts)
+        return bool(_STACK.contexts)
 
     @classmethod
     def active_context(cls):
         """Returns the currently active queuing context."""
-        if cls.recording():
-            return cls._active_contexts[-1]
+        # Note: the methods below index the stack of active contexts directly,
+        # rather than calling this method, as they are called once for every
+        # queued object.
+        contexts = _STACK.contexts
+
+        if contexts:
+            return contexts[-1]
 
         return None
 
@@ -149,8 +175,10 @@ class QueuingContext(abc.ABC):
         Args:
             obj: the object to be appended
         """
-        if cls.recording():
-            cls.active_context()._append(obj, **kwargs)  # pylint: disable=protected-access
+        contexts = _STACK.contexts
+
+        if contexts:
+            contexts[-1]._append(obj, **kwargs)  # pylint: disable=protected-access
 
     @abc.abstractmethod
     def _remove(self, obj):
@@ -167,8 +195,10 @@ class QueuingContext(abc.ABC):
         Args:
             obj: the object to be removed
         """
-        if cls.recording():
-            cls.active_context()._remove(obj)  # pylint: disable=protected-access
+        contexts = _STACK.contexts
+
+        if contexts:
+            contexts[-1]._remove(obj)  # pylint: disable=protected-access
 
     @classmethod
     def update_info(cls, obj, **kwargs):
@@ -177,8 +207,10 @@ class QueuingContext(abc.ABC):
         Args:
             obj: the object with metadata to be updated
         """
-        if cls.recording():
-            cls.active_context()._update_info(obj, **kwargs)  # pylint: disable=protected-access
+        contexts = _STACK.contexts
+
+        if contexts:
+            contexts[-1]._update_info(obj, **kwargs)  # pylint: disable=protected-access
 
     def _update_info(self, obj, **kwargs):
         """Updates information of an object in the queue instance."""
@@ -194,8 +226,10 @@ class QueuingContext(abc.ABC):
         Returns:
             object metadata
         """
-        if cls.recording():
-            return cls.active_context()._get_info(obj)  # pylint: disable=protected-access
+        contexts = _STACK.contexts
+
+        if contexts:
+            return contexts[-1]._get_info(obj)  # pylint: disable=protected-access
 
         return None
 
@@ -222,7 +256,8 @@ class AnnotatedQueue(QueuingContext):
     to metadata annotations."""
 
     def __init__(self):
-        self._queue = OrderedDict()
+        # dictionaries preserve insertion order
+        self._queue = {}
 
     def _append(self, obj, **kwargs):
         self._queue[obj] = kwargs
@@ -27,6 +27,7 @@ import pennylane as qml
 from pennylane.beta.queuing import MeasurementProcess
 
 from .qubit_param_shift import QubitParamShiftTape
+from .tape import GradMethod
 
 
 class CVParamShiftTape(QubitParamShiftTape):
@@ -102,7 +103,7 @@ class CVParamShiftTape(QubitParamShiftTape):
     """
 
     def _grad_method(self, idx, use_graph=True, default_method="A"):
-        op = self._par_info[idx]["op"]
+        op = self._par_ops[idx]
 
         if op.grad_method in (None, "F"):
             return op.grad_method
@@ -235,20 +236,22 @@ class CVParamShiftTape(QubitParamShiftTape):
             array[float]: 1-dimensional array of length determined by the tape output
             measurement statistics
         """
-        t_idx = list(self.trainable_params)[idx]
-        op = self._par_info[t_idx]["op"]
-        p_idx = self._par_info[t_idx]["p_idx"]
+        return self._shifted_pd(idx, device, params, **options)
 
-        recipe = op.grad_recipe[p_idx]
-        c, s = (0.5, np.pi / 2) if recipe is None else recipe
+    def _shift_recipe(self, idx, **options):
+        t_idx = self._trainable_idx[idx]
+        op = self._par_ops[t_idx]
+        p_idx = self._par_p_idx[t_idx]
 
-        shift = np.zeros_like(params)
-        shift[idx] = s
+        recipe = op.grad_recipe[p_idx]
+        return (0.5, np.pi / 2) if recipe is None else tuple(recipe)
 
-        shift_forward = np.array(self.execute_device(params + shift, device))
-        shift_backward = np.array(self.execute_device(params - shift, device))
+    def _shift_indices(self, **options):
+        if options.get("force_order2", False):
+            # all parameters are differentiated using the second-order rule
+            return np.array([], dtype=int)
 
-        return c * (shift_forward - shift_backward)
+        return super()._shift_indices(**options)
 
     def parameter_shift_second_order(self, idx, device, params, **options):
         r"""Partial derivative using the second-order CV parameter-shift rule of a
@@ -285,9 +288,9 @@ class CVParamShiftTape(QubitParamShiftTape):
             )
             return self.numeric_pd(idx, device, params, **options)
 
-        t_idx = list(self.trainable_params)[idx]
-        op = self._par_info[t_idx]["op"]
-        p_idx = self._par_info[t_idx]["p_idx"]
+        t_idx = self._trainable_idx[idx]
+        op = self._par_ops[t_idx]
+        p_idx = self._par_p_idx[t_idx]
 
         recipe = op.grad_recipe[p_idx]
         c, s = (0.5, np.pi / 2) if recipe is None else recipe
@@ -381,9 +384,9 @@ class CVParamShiftTape(QubitParamShiftTape):
             array[float]: 1-dimensional array of length determined by the tape output
             measurement statistics
         """
-        grad_method = self._par_info[idx]["grad_method"]
+        grad_method = self._par_grad_method[idx]
 
-        if options.get("force_order2", False) or grad_method == "A2":
+        if options.get("force_order2", False) or grad_method == GradMethod.A2:
             return self.parameter_shift_second_order(idx, device, params, **options)
 
         return self.parameter_shift_first_order(idx, device, params, **options)
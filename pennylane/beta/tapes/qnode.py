@@ -148,6 +148,11 @@ class QNode:
         self.dtype = np.float64
         self.max_expansion = 2
 
+        self._stop_at = None
+        """set[str]: names of the operations that are not expanded when constructing the
+        tape. This depends only on the device and the tape class, so it is determined
+        once, on first construction."""
+
         self._caching = caching
         """float: number of device executions to store in a cache to speed up subsequent
         executions. If set to zero, no caching occurs."""
@@ -396,16 +401,19 @@ class QNode:
         # provide the jacobian options
         self.qtape.jacobian_options = self.diff_options
 
-        stop_at = self.device.operations
+        if self._stop_at is None:
+            self._stop_at = set(self.device.operations)
+
+            # Hotfix that allows controlled rotations to return the correct gradients
+            # when using the parameter shift rule.
+            if isinstance(self.qtape, QubitParamShiftTape):
+                # controlled rotations aren't supported by the parameter-shift rule
+                self._stop_at -= {"CRX", "CRZ", "CRY", "CRot"}
 
-        # Hotfix that allows controlled rotations to return the correct gradients
-        # when using the parameter shift rule.
-        if isinstance(self.qtape, QubitParamShiftTape):
-            # controlled rotations aren't supported by the parameter-shift rule
-            stop_at = set(self.device.operations) - {"CRX", "CRZ", "CRY", "CRot"}
+        stop_at = self._stop_at
 
         # expand out the tape, if any operations are not supported on the device
-        if not {op.name for op in self.qtape.operations}.issubset(stop_at):
+        if not stop_at.issuperset([op.name for op in self.qtape.operations]):
             self.qtape = self.qtape.expand(
                 depth=self.max_expansion, stop_at=lambda obj: obj.name in stop_at
             )
@@ -24,7 +24,7 @@ import numpy as np
 import pennylane as qml
 from pennylane.beta.queuing import MeasurementProcess
 
-from .tape import QuantumTape
+from .tape import GradMethod, QuantumTape
 
 
 class QubitParamShiftTape(QuantumTape):
@@ -80,6 +80,19 @@ class QubitParamShiftTape(QuantumTape):
     allowing us to compute the gradient using :math:`2N + 1` evaluations.
     """
 
+    _shift_results = None
+    """dict[tuple, dict[int, array[float]]] or None: partial derivatives computed using
+    the two-term parameter-shift rule during a Jacobian computation, indexed by the
+    measurements of the tape and the trainable parameter index. ``None`` outside of
+    Jacobian computations."""
+
+    _var_measurements = None
+    """tuple[list, list or None, list[int]] or None: the measurements used to compute the
+    partial derivatives of variances during a Jacobian computation; the measurements with
+    variances replaced by expectation values, the measurements with non-involutory observables
+    additionally squared (if any), and the indices of the involutory variances. ``None``
+    outside of Jacobian computations."""
+
     def _update_circuit_info(self):
         super()._update_circuit_info()
 
@@ -103,7 +116,7 @@ class QubitParamShiftTape(QuantumTape):
             self.var_idx = np.where(self.var_mask)[0]
 
     def _grad_method(self, idx, use_graph=True, default_method="A"):
-        op = self._par_info[idx]["op"]
+        op = self._par_ops[idx]
 
         if op.grad_method == "F":
             return "F"
@@ -116,7 +129,107 @@ class QubitParamShiftTape(QuantumTape):
         # self._evA attribute. Here, we set the value of the attribute to None
         # before each Jacobian call, so that the expectation value is calculated only once.
         self._evA = None
-        return super().jacobian(device, params, **options)
+
+        # The shifted tapes of all parameters differentiated using the parameter-shift rule
+        # are executed as a single batch on the first call to _shifted_pd, and the
+        # resulting partial derivatives stored for the remainder of the Jacobian call.
+        self._shift_results = {}
+
+        try:
+            return super().jacobian(device, params, **options)
+        finally:
+            self._shift_results = None
+            self._var_measurements = None
+
+    def _shift_recipe(self, idx, **options):
+        """Returns the multiplier and shift of the two-term parameter-shift rule
+        of a trainable parameter.
+
+        Args:
+            idx (int): trainable parameter index
+
+        Keyword Args:
+            shift (float): the parameter shift value
+
+        Returns:
+            tuple[float, float]: the multiplier :math:`c` and shift :math:`s`, such that the
+            partial derivative is given by :math:`c[f(p+s) - f(p-s)]`
+        """
+        t_idx = self._trainable_idx[idx]
+        op = self._par_ops[t_idx]
+        p_idx = self._par_p_idx[t_idx]
+
+        s = (
+            np.pi / 2
+            if op.grad_recipe is None or op.grad_recipe[p_idx] is None
+            else op.grad_recipe[p_idx]
+        )
+        s = options.get("shift", s)
+
+        return 1 / (2 * np.sin(s)), s
+
+    def _shift_indices(self, **options):  # pylint: disable=unused-argument
+        """Returns the trainable parameter indices differentiated using the two-term
+        parameter-shift rule during a Jacobian computation.
+
+        Returns:
+            array[int]: the trainable parameter indices
+        """
+        return np.flatnonzero(self._par_grad_method[self._trainable_idx] == GradMethod.A)
+
+    def _shifted_pd(self, idx, device, params, **options):
+        """Partial derivative of the tape using the two-term parameter-shift rule, with the
+        multiplier and shift provided by :meth:`~._shift_recipe`.
+
+        During a Jacobian computation, the forward and backward shifted parameters of
+        all parameters returned by :meth:`~._shift_indices` are submitted for execution
+        as a single batch on the first call, and the partial derivatives are stored for
+        subsequent calls with the same tape measurements.
+
+        Args:
+            idx (int): trainable parameter index to differentiate with respect to
+            device (.Device, .QubitDevice): a PennyLane device
+                that can execute quantum operations and return measurement statistics
+            params (list[Any]): the quantum tape operation parameters
+
+        Returns:
+            array[float]: 1-dimensional array of length determined by the tape output
+            measurement statistics
+        """
+        indices = [idx]
+        results = None
+
+        if self._shift_results is not None:
+            results = self._shift_results.setdefault(tuple(self._measurements), {})
+
+            if idx in results:
+                return results[idx]
+
+            batched = self._shift_indices(**options).tolist()
+
+            if idx in batched:
+                indices = batched
+
+        recipes = [self._shift_recipe(i, **options) for i in indices]
+        shifted = []
+
+        for i, (_, s) in zip(indices, recipes):
+            shift = np.zeros_like(params)
+            shift[i] = s
+            shifted.extend([params + shift, params - shift])
+
+        # the forward and backward shifted parameters of all parameters
+        # are submitted as a single batch
+        res = self.batch_execute_device(shifted, device, parallel=options.get("parallel"))
+        pd = {}
+
+        for k, (i, (c, _)) in enumerate(zip(indices, recipes)):
+            pd[i] = c * (res[2 * k] - res[2 * k + 1])
+
+        if results is not None:
+            results.update(pd)
+
+        return pd[idx]
 
     def parameter_shift(self, idx, device, params, **options):
         r"""Partial derivative using the parameter-shift rule of a tape consisting of measurement
@@ -139,29 +252,14 @@ class QubitParamShiftTape(QuantumTape):
 
         Keyword Args:
             shift (float): the parameter shift value
+            parallel=None (None or str): If ``"thread"``, the shifted tapes are executed
+                concurrently using a thread pool
 
         Returns:
             array[float]: 1-dimensional array of length determined by the tape output
             measurement statistics
         """
-        t_idx = list(self.trainable_params)[idx]
-        op = self._par_info[t_idx]["op"]
-        p_idx = self._par_info[t_idx]["p_idx"]
-
-        s = (
-            np.pi / 2
-            if op.grad_recipe is None or op.grad_recipe[p_idx] is None
-            else op.grad_recipe[p_idx]
-        )
-        s = options.get("shift", s)
-
-        shift = np.zeros_like(params)
-        shift[idx] = s
-
-        shift_forward = np.array(self.execute_device(params + shift, device))
-        shift_backward = np.array(self.execute_device(params - shift, device))
-
-        return (shift_forward - shift_backward) / (2 * np.sin(s))
+        return self._shifted_pd(idx, device, params, **options)
 
     def parameter_shift_var(self, idx, device, params, **options):
         r"""Partial derivative using the parameter-shift rule of a tape consisting of a mixture
@@ -177,10 +275,46 @@ class QubitParamShiftTape(QuantumTape):
             array[float]: 1-dimensional array of length determined by the tape output
             measurement statistics
         """
-        # Temporarily convert all variance measurements on the tape into expectation values
-        for i in self.var_idx:
-            obs = self._measurements[i].obs
-            self._measurements[i] = MeasurementProcess(qml.operation.Expectation, obs=obs)
+        var_measurements = self._var_measurements
+
+        if var_measurements is None:
+            # Temporarily convert all variance measurements on the tape into expectation values
+            expectations = self._measurements.copy()
+
+            for i in self.var_idx:
+                obs = expectations[i].obs
+                expectations[i] = MeasurementProcess(qml.operation.Expectation, obs=obs)
+
+            # For involutory observables (A^2 = I) we have d<A^2>/dp = 0.
+            # Currently, the only observable we have in PL that may be non-involutory is qml.Hermitian
+            involutory = [i for i in self.var_idx if self.observables[i].name != "Hermitian"]
+
+            # If there are non-involutory observables A present, we must compute d<A^2>/dp.
+            non_involutory = set(self.var_idx) - set(involutory)
+            squares = None
+
+            if non_involutory:
+                squares = expectations.copy()
+
+            for i in non_involutory:
+                # We need to calculate d<A^2>/dp; to do so, we replace the
+                # involutory observables A in the queue with A^2.
+                obs = squares[i].obs
+                A = obs.matrix
+
+                obs = qml.Hermitian(A @ A, wires=obs.wires, do_queue=False)
+                squares[i] = MeasurementProcess(qml.operation.Expectation, obs=obs)
+
+            var_measurements = (expectations, squares, involutory)
+
+            if self._shift_results is not None:
+                # Within a Jacobian computation, the modified measurements are reused
+                # for all parameters, so that the partial derivatives of all parameters
+                # using the same measurements can be computed together.
+                self._var_measurements = var_measurements
+
+        expectations, squares, involutory = var_measurements
+        self._measurements = expectations
 
         # Get <A>, the expectation value of the tape with unshifted parameters. This is only
         # calculated once, if `self._evA` is not None.
@@ -190,29 +324,14 @@ class QubitParamShiftTape(QuantumTape):
         # evaluate the analytic derivative of <A>
         pdA = self.parameter_shift(idx, device, params, **options)
 
-        # For involutory observables (A^2 = I) we have d<A^2>/dp = 0.
-        # Currently, the only observable we have in PL that may be non-involutory is qml.Hermitian
-        involutory = [i for i in self.var_idx if self.observables[i].name != "Hermitian"]
-
-        # If there are non-involutory observables A present, we must compute d<A^2>/dp.
-        non_involutory = set(self.var_idx) - set(involutory)
-
-        for i in non_involutory:
-            # We need to calculate d<A^2>/dp; to do so, we replace the
-            # involutory observables A in the queue with A^2.
-            obs = self._measurements[i].obs
-            A = obs.matrix
-
-            obs = qml.Hermitian(A @ A, wires=obs.wires, do_queue=False)
-            self._measurements[i] = MeasurementProcess(qml.operation.Expectation, obs=obs)
-
         pdA2 = 0
 
-        if non_involutory:
+        if squares is not None:
             # Non-involutory observables are present; the partial derivative of <A^2>
             # may be non-zero. Here, we calculate the analytic derivatives of the <A^2>
             # observables.
-            pdA2 = self.parameter_shift(idx, device, params, **options)
+            self._measurements = squares
+            pdA2 = self.parameter_shift(idx, device, params, **options).copy()
 
             if involutory:
                 # We need to explicitly specify that the gradient of
@@ -15,19 +15,198 @@
 Quantum tape that implements reversible backpropagation.
 """
 # pylint: disable=attribute-defined-outside-init,protected-access
-from copy import copy
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numbers
+import os
 from string import ascii_letters as ABC
+import threading
+import weakref
 
 import numpy as np
 
 import pennylane as qml
 
-from .tape import QuantumTape
+from .tape import GradMethod, QuantumTape
 
 
 ABC_ARRAY = np.array(list(ABC))
 
+_GENERATOR_MATRICES = {
+    "PauliX": np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    "PauliY": np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    "PauliZ": np.array([[1, 0], [0, -1]], dtype=np.complex128),
+}
+"""dict[str, array[complex]]: matrices of the generators of the supported gates,
+indexed by the generator name."""
+
+_GRAD_PRECISION_DTYPES = {"double": None, "single": np.complex64}
+"""dict[str, type]: complex data types used by the reversible gradient
+computation for each supported precision; ``None`` corresponds to the
+device's own complex data type."""
+
+_NUM_THREADS = max(1, (os.cpu_count() or 1) // 2)
+"""int: number of threads used to apply multiple observables to a statevector in parallel."""
+
+_thread_pool = None
+"""ThreadPoolExecutor: thread pool used to apply multiple observables to a statevector
+in parallel. NumPy releases the GIL during the contractions, so the threads
+are able to run concurrently. The pool is only created once it is first required,
+by :func:`_get_thread_pool`."""
+
+_thread_pool_lock = threading.Lock()
+
+_PARALLEL_MIN_WIRES = 14
+"""int: minimum number of wires for which observables are applied in parallel;
+for smaller statevectors, the thread overhead outweighs the benefits."""
+
+_reshaped_matrix_cache = weakref.WeakKeyDictionary()
+"""WeakKeyDictionary[.Observable, tuple[list, array]]: cache of the observable
+matrices reshaped into tensors, alongside the observable parameters they were
+computed from."""
+
+
+def _get_thread_pool():
+    """Returns the thread pool used to apply multiple observables to a statevector
+    in parallel, creating it with ``_NUM_THREADS`` workers on first use.
+
+    Returns:
+        ThreadPoolExecutor: the thread pool
+    """
+    global _thread_pool  # pylint: disable=global-statement
+
+    with _thread_pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=_NUM_THREADS)
+
+    return _thread_pool
+
+
+def _reshaped_matrix(obs):
+    """Returns the matrix of an observable, reshaped into a tensor with
+    one input and one output index per wire.
+
+    Since observables are shared between Jacobian evaluations and between
+    parameters, the reshaped matrix is cached on a per-observable basis.
+    The cached matrix is discarded if any of the observable parameters have
+    since been replaced.
+
+    Args:
+        obs (.Observable): a PennyLane observable
+
+    Returns:
+        array[complex]: the reshaped observable matrix
+    """
+    data = obs.data
+    cached = _reshaped_matrix_cache.get(obs, None)
+
+    if cached is not None and len(cached[0]) == len(data):
+        if all(p is q for p, q in zip(cached[0], data)):
+            return cached[1]
+
+    mat = np.reshape(obs.matrix, [2] * len(obs.wires) * 2)
+    _reshaped_matrix_cache[obs] = (list(data), mat)
+    return mat
+
+
+def _compile_contraction(einsum_str, path):
+    """Compiles an einsum contraction and its contraction path into a sequence
+    of pairwise contraction steps.
+
+    Calling ``np.einsum`` with a precomputed path still requires the subscripts and
+    path to be parsed and validated on every call. Compiling the contraction once
+    allows it to be replayed by :func:`_contract` with a single einsum call per step.
+
+    Args:
+        einsum_str (str): the einsum subscripts, including the output subscripts
+        path (list): the contraction path, in the format returned by ``np.einsum_path``
+
+    Returns:
+        list[tuple[tuple[int], str, tuple or None]]: the contraction steps; each step
+        consists of the positions of the operands to contract, in decreasing order, the
+        einsum subscripts of their contraction, and, for pairwise contractions that can be
+        performed by ``tensordot``, the tensordot axes and the permutation of the result
+    """
+    inputs, output = einsum_str.split("->")
+    terms = inputs.split(",")
+    steps = []
+
+    for positions in path[1:]:
+        positions = tuple(sorted(positions, reverse=True))
+        contracted = [terms.pop(i) for i in positions]
+
+        # indices are kept if they are required by the remaining terms or the output
+        remaining = set("".join(terms) + output)
+        result = "".join(i for i in dict.fromkeys("".join(contracted)) if i in remaining)
+
+        step = "{}->{}".format(",".join(contracted), result)
+        steps.append((positions, step, _tensordot_spec(contracted, result)))
+        terms.append(result)
+
+    if terms != [output]:
+        # permute the final result into the output order
+        steps.append(((0,), "{}->{}".format(terms[0], output), None))
+
+    return steps
+
+
+def _tensordot_spec(terms, result):
+    """Determines whether a contraction can be performed by ``tensordot``, which,
+    unlike ``einsum``, dispatches to BLAS.
+
+    Args:
+        terms (list[str]): the subscripts of the operands
+        result (str): the subscripts of the result
+
+    Returns:
+        tuple or None: the tensordot axes of both operands, and the permutation to apply to
+        the tensordot result (or ``None`` if no permutation is required). ``None`` is returned
+        if the contraction cannot be performed by ``tensordot``.
+    """
+    if len(terms) != 2:
+        return None
+
+    a, b = terms
+    summed = [i for i in a if i in b]
+
+    # tensordot requires all shared indices to be summed, and all other indices to be kept
+    if any(i in result for i in summed) or len(a) + len(b) - 2 * len(summed) != len(result):
+        return None
+
+    axes = ([a.index(i) for i in summed], [b.index(i) for i in summed])
+    tensordot_result = "".join(i for i in a + b if i not in summed)
+    perm = [tensordot_result.index(i) for i in result]
+
+    return axes, (None if perm == sorted(perm) else perm)
+
+
+def _contract(steps, operands, device):
+    """Performs a contraction compiled using :func:`_compile_contraction`.
+
+    Args:
+        steps (list[tuple]): the compiled contraction steps
+        operands (list[array]): the operands of the contraction
+        device (.QubitDevice): the device whose numerical backend is used
+
+    Returns:
+        array: the result of the contraction
+    """
+    # pylint: disable=protected-access
+    operands = list(operands)
+
+    for positions, einsum_str, tensordot_spec in steps:
+        contracted = [operands.pop(i) for i in positions]
+
+        if tensordot_spec is None:
+            operands.append(device._einsum(einsum_str, *contracted))
+            continue
+
+        axes, perm = tensordot_spec
+        res = device._tensordot(*contracted, axes=axes)
+        operands.append(res if perm is None else device._transpose(res, perm))
+
+    return operands[0]
+
 
 class ReversibleTape(QuantumTape):
     r"""Quantum tape for computing gradients via reversible analytic differentiation.
@@ -50,6 +229,25 @@ class ReversibleTape(QuantumTape):
 
     For more details on the quantum tape, please see :class:`~.QuantumTape`.
 
+    In addition to the options of :meth:`~.QuantumTape.jacobian`, the following keyword
+    arguments may be passed to the Jacobian method, or to a QNode using ``diff_method="reversible"``:
+
+    * ``grad_precision="double"`` (str): The precision of the statevector arithmetic used to
+      compute the gradient. If ``"single"``, the computation is performed using
+      single-precision complex numbers, reducing memory traffic at the cost of accuracy;
+      the forward pass is not affected.
+
+    * ``k_params=None`` (int): If provided, only ``k_params`` trainable parameters,
+      sampled uniformly without replacement, are differentiated during each Jacobian
+      evaluation; the partial derivatives of the remaining parameters are set to zero.
+      This provides a cheap, stochastic estimate of the Jacobian for circuits with many
+      parameters. Independent parameters, with a gradient of zero, are never sampled.
+      Must be a positive integer.
+
+    * ``seed=None`` (int or numpy.random.Generator): Seed or random number generator used
+      to sample the ``k_params`` differentiated parameters. If not provided, a freshly
+      seeded generator is used; NumPy's global random state is never used.
+
     **Reversible analytic differentiation**
 
     Assume a circuit has a gate :math:`G(\theta)` that we want to differentiate.
@@ -66,6 +264,13 @@ class ReversibleTape(QuantumTape):
     Some further post-processing of this gives the derivative
     :math:`\frac{\partial}{\partial\theta} \langle \hat{O} \rangle` for any observable O.
 
+    In practice, the forward evolution using :math:`V` is avoided: the states
+    :math:`\hat{O}\vert\psi\rangle` are instead rewound alongside the pre-measurement state,
+    and the derivative is computed from their overlap with the state after applying the generator.
+    When differentiating multiple gates, the gates are processed in reverse order, and the
+    rewound states of each gate are used as the starting point for rewinding to the next;
+    as a result, each gate in the circuit is only applied once.
+
     The reversible approach is similar to backpropagation, but trades off extra computation for
     enhanced memory efficiency. Where backpropagation caches the state tensors at each step during
     a forward pass, the reversible method only caches the final pre-measurement state.
@@ -79,6 +284,49 @@ class ReversibleTape(QuantumTape):
     def _grad_method(self, idx, use_graph=True, default_method="A"):
         return super()._grad_method(idx, use_graph=use_graph, default_method=default_method)
 
+    @staticmethod
+    @lru_cache()
+    def _build_indices(num_wires, wires):
+        """Builds the einsum subscripts used to compute matrix elements, alongside
+        the optimal contraction path.
+
+        Since the subscripts and path only depend on the number of wires and the
+        observable wires, the results for the most recently used combinations are cached.
+        The contraction path is compiled into pairwise contraction steps, which are
+        performed using :func:`_contract`.
+
+        Args:
+            num_wires (int): number of wires of the statevectors
+            wires (tuple): wires the observable acts on
+
+        Returns:
+            tuple[str, list]: the einsum subscripts, and the compiled contraction steps
+        """
+        vec1_indices = ABC[:num_wires]
+
+        obs_in_indices = "".join(ABC_ARRAY[list(wires)].tolist())
+        obs_out_indices = ABC[num_wires : num_wires + len(wires)]
+        obs_indices = "".join([obs_in_indices, obs_out_indices])
+
+        # the measured wires of the second vector are contracted with the
+        # output indices of the observable
+        vec2_indices = vec1_indices.translate(str.maketrans(obs_in_indices, obs_out_indices))
+
+        einsum_str = "{vec1_indices},{obs_indices},{vec2_indices}->".format(
+            vec1_indices=vec1_indices,
+            obs_indices=obs_indices,
+            vec2_indices=vec2_indices,
+        )
+
+        # every index has dimension 2
+        operands = [
+            np.broadcast_to(np.complex128(0), [2] * len(term))
+            for term in (vec1_indices, obs_indices, vec2_indices)
+        ]
+        path = np.einsum_path(einsum_str, *operands, optimize="optimal")[0]
+
+        return einsum_str, _compile_contraction(einsum_str, path)
+
     @staticmethod
     def _matrix_elem(vec1, obs, vec2, device):
         r"""Computes the matrix element of an observable.
@@ -94,42 +342,382 @@ class ReversibleTape(QuantumTape):
             device (.QubitDevice): the device used to compute the matrix elements
         """
         # pylint: disable=protected-access
-        mat = device._reshape(obs.matrix, [2] * len(obs.wires) * 2)
-        wires = obs.wires
+        mat = _reshaped_matrix(obs)
+        _, steps = ReversibleTape._build_indices(device.num_wires, tuple(obs.wires.tolist()))
+        return _contract(steps, [device._conj(vec1), mat, vec2], device)
 
-        vec1_indices = ABC[: device.num_wires]
+    def jacobian(self, device, params=None, **options):
+        # The analytic partial derivatives of all parameters are computed during a single
+        # reverse sweep over the circuit, on the first call to analytic_pd; this requires
+        # the pre-rotated statevector, stored in the self._state attribute, and stores the
+        # results in the self._pd attribute. Here, we reset these attributes before each
+        # Jacobian call, so that the statevector and sweep are computed only once.
+        self._state = None
+        self._pd = {}
+        return super().jacobian(device, params, **options)
 
-        obs_in_indices = "".join(ABC_ARRAY[wires.tolist()].tolist())
-        obs_out_indices = ABC[device.num_wires : device.num_wires + len(wires)]
-        obs_indices = "".join([obs_in_indices, obs_out_indices])
+    @staticmethod
+    @lru_cache()
+    def _build_evolution_indices(num_wires, op_axes, batched=False):
+        """Builds the einsum subscripts and contraction path of the tensor network
+        representing the evolution of a statevector under a sequence of gates.
 
-        vec2_indices = reduce(
-            lambda old_string, idx_pair: old_string.replace(idx_pair[0], idx_pair[1]),
-            zip(obs_in_indices, obs_out_indices),
-            vec1_indices,
-        )
+        Each gate tensor contracts the current indices of the wires it acts on,
+        and introduces new indices for these wires; the output indices are
+        the final indices of each wire.
 
-        einsum_str = "{vec1_indices},{obs_indices},{vec2_indices}->".format(
-            vec1_indices=vec1_indices,
-            obs_indices=obs_indices,
-            vec2_indices=vec2_indices,
+        Since the subscripts and path only depend on the number of wires and the
+        wires the gates act on, the results for the most recently used gate sequences are
+        cached. The contraction path is compiled into pairwise contraction steps, which
+        are performed using :func:`_contract`.
+
+        Args:
+            num_wires (int): number of wires of the statevector
+            op_axes (tuple[tuple[int]]): the statevector axes each gate acts on,
+                in order of application
+            batched (bool): if ``True``, the statevector is expected to have
+                an additional leading batch dimension, which is not contracted
+
+        Returns:
+            tuple[str, list]: the einsum subscripts, with the gate tensors followed by the
+            statevector, and the compiled contraction steps
+        """
+        wire_indices = list(ABC[:num_wires])
+        batch_index = ABC[num_wires] if batched else ""
+        terms = []
+        next_index = num_wires + len(batch_index)
+
+        for axes in op_axes:
+            new_indices = ABC[next_index : next_index + len(axes)]
+            next_index += len(axes)
+
+            terms.append(new_indices + "".join(wire_indices[a] for a in axes))
+
+            for a, idx in zip(axes, new_indices):
+                wire_indices[a] = idx
+
+        terms.append(batch_index + ABC[:num_wires])
+        einsum_str = "{}->{}".format(",".join(terms), batch_index + "".join(wire_indices))
+
+        operands = [np.broadcast_to(np.complex128(0), [2] * len(term)) for term in terms]
+        path = np.einsum_path(einsum_str, *operands, optimize="greedy")[0]
+
+        return einsum_str, _compile_contraction(einsum_str, path)
+
+    @staticmethod
+    def _evolve(state, operations, device, batched=False, dtype=None, inverse=False):
+        """Evolves a statevector under a list of operations.
+
+        Rather than executing the operations on the device one by one, the
+        operations and the statevector are treated as a tensor network, which is
+        contracted using precompiled contraction steps. Gates acting on the same wires
+        may then be contracted together before being applied to the statevector.
+
+        Args:
+            state (array[complex]): the initial statevector
+            operations (list[.Operation]): operations to apply
+            device (.QubitDevice): the device whose wires and numerical backend
+                are used to apply the operations
+            batched (bool): if ``True``, ``state`` is a stack of statevectors
+                along its first dimension, which are all evolved simultaneously
+            dtype (type): the complex data type of the gate matrices; if not
+                provided, ``device.C_DTYPE`` is used
+            inverse (bool): if ``True``, the inverse of the operations are applied in
+                reverse order, undoing the evolution; this avoids copying and inverting
+                the operations themselves
+
+        Returns:
+            array[complex]: the evolved statevector
+        """
+        # pylint: disable=protected-access
+        if inverse:
+            operations = operations[::-1]
+
+        op_axes = [tuple(device.wires.indices(op.wires)) for op in operations]
+
+        # The number of available einsum indices is limited; split the operations
+        # into segments that can each be represented by a single einsum call.
+        start = 0
+        num_state_indices = device.num_wires + int(batched)
+        num_indices = num_state_indices
+
+        for i, axes in enumerate(op_axes + [None]):
+            if axes is not None and num_indices + len(axes) <= len(ABC):
+                num_indices += len(axes)
+                continue
+
+            if i > start:
+                _, steps = ReversibleTape._build_evolution_indices(
+                    device.num_wires, tuple(op_axes[start:i]), batched=batched
+                )
+                mats = [op.matrix for op in operations[start:i]]
+
+                if inverse:
+                    mats = [device._conj(device._transpose(mat)) for mat in mats]
+
+                mats = [
+                    device._cast(
+                        device._reshape(mat, [2] * len(axes) * 2), dtype=dtype or device.C_DTYPE
+                    )
+                    for mat, axes in zip(mats, op_axes[start:i])
+                ]
+                state = _contract(steps, mats + [state], device)
+
+            start = i
+            num_indices = num_state_indices + (len(axes) if axes is not None else 0)
+
+        return state
+
+    @staticmethod
+    def _apply_generator(state, generator, axes, device, dtype=None):
+        """Applies the generator of a gate to a statevector.
+
+        Generators supported by the device's specialized array manipulations,
+        such as the Pauli generators of the :class:`~.RX`, :class:`~.RY`, and :class:`~.RZ`
+        gates on ``default.qubit``, are applied directly to the statevector, avoiding
+        a matrix multiplication. Otherwise, the precomputed generator matrix is applied.
+        In both cases, no generator observable needs to be instantiated.
+
+        Args:
+            state (array[complex]): the statevector
+            generator (str): the name of the generator to apply
+            axes (tuple[int]): the statevector axes the generator acts on
+            device (.QubitDevice): the device used to apply the generator
+            dtype (type): the complex data type of the generator matrix, if it is
+                not supported by the device's array manipulations
+
+        Returns:
+            array[complex]: the resulting statevector
+        """
+        # pylint: disable=protected-access
+        apply_ops = getattr(device, "_apply_ops", {})
+
+        if generator in apply_ops:
+            return apply_ops[generator](state, axes)
+
+        mat = device._cast(_GENERATOR_MATRICES[generator], dtype=dtype or device.C_DTYPE)
+        _, steps = ReversibleTape._build_evolution_indices(device.num_wires, (tuple(axes),))
+        return _contract(steps, [mat, state], device)
+
+    @staticmethod
+    def _apply_observables(state, observables, device, dtype=None):
+        """Applies each observable to a statevector.
+
+        For large statevectors, the observables are applied in parallel using a thread pool.
+
+        Args:
+            state (array[complex]): the statevector
+            observables (list[.Observable]): a list of PennyLane observables
+            device (.QubitDevice): the device used to apply the observables
+            dtype (type): the complex data type of the observable matrices; if not
+                provided, ``device.C_DTYPE`` is used
+
+        Returns:
+            array[complex]: the stack of resulting statevectors, in the same order
+            as ``observables``
+        """
+        # pylint: disable=protected-access
+        def apply(obs):
+            axes = tuple(device.wires.indices(obs.wires))
+            _, steps = ReversibleTape._build_evolution_indices(device.num_wires, (axes,))
+            mat = device._cast(_reshaped_matrix(obs), dtype=dtype or device.C_DTYPE)
+            return _contract(steps, [mat, state], device)
+
+        parallel = (
+            _NUM_THREADS > 1 and len(observables) > 1 and device.num_wires >= _PARALLEL_MIN_WIRES
         )
 
-        return device._einsum(einsum_str, device._conj(vec1), mat, vec2)
+        if parallel:
+            return device._stack(list(_get_thread_pool().map(apply, observables)))
 
-    def jacobian(self, device, params=None, **options):
-        # The parameter_shift_var method needs to evaluate the circuit
-        # at the unshifted parameter values; the pre-rotated statevector is then stored
-        # self._state attribute. Here, we set the value of the attribute to None
-        # before each Jacobian call, so that the statevector is calculated only once.
-        self._state = None
-        return super().jacobian(device, params, **options)
+        return device._stack([apply(obs) for obs in observables])
+
+    def _reverse_sweep(self, device, dtype=None, param_indices=None):
+        r"""Computes the partial derivatives of all differentiable trainable parameters.
+
+        Rather than replaying the differentiated states forward to the pre-measurement
+        step, the observables are applied to the pre-measurement state, and the resulting
+        states are rewound alongside it. For a gate :math:`G` followed by the unitary
+        :math:`V`, the required matrix elements then follow from
+
+        .. math::
+
+            \langle \psi \vert V^\dagger \hat{O} V G \vert \psi \rangle
+            = (V^\dagger \hat{O} V \vert \psi \rangle)^\dagger G \vert \psi \rangle,
+
+        where :math:`\vert \psi \rangle` is the state just after :math:`G`.
+
+        The pre-measurement state and observable states are rewound as a single batch,
+        a single time, starting from the last differentiated gate. At each differentiated
+        gate, the generator is applied to the rewound state, and the matrix elements with
+        the rewound observable states are computed. As a result, each gate in the circuit
+        is only applied once, to all states, using a single contraction.
+
+        The partial derivatives are stored in the ``_pd`` attribute, a dictionary mapping
+        trainable parameter indices to derivatives.
+
+        Args:
+            device (.QubitDevice): the device used to compute the derivatives
+            dtype (type): the complex data type used for the statevector arithmetic; if not
+                provided, ``device.C_DTYPE`` is used
+            param_indices (set[int]): the trainable parameter indices to differentiate;
+                if not provided, all trainable parameters are differentiated
+        """
+        # Flatten the operations, decomposing any Rot gate with parameters to be
+        # differentiated, so that each differentiated parameter corresponds to a single gate.
+        # The tuple (position, generator name, generator axes, multiplier, trainable index)
+        # is stored for each differentiated parameter.
+        ops = []
+        diff_gates = []
+        rot_decompositions = {}
+
+        # Whether each observable is causally affected by each differentiated gate;
+        # the partial derivatives of unaffected observables are identically zero.
+        # A gate acting on a wire of an observable always affects it; otherwise,
+        # the ancestors of the observable are determined from the circuit graph.
+        # The ancestors of each observable are only computed once, if required.
+        observables = self.observables
+        obs_wires = [set(ob.wires.labels) for ob in observables]
+        ancestors = {}
+
+        def affects(op, j):
+            if not obs_wires[j].isdisjoint(op.wires.labels):
+                return True
+
+            if j not in ancestors:
+                ancestors[j] = self.graph.ancestors([observables[j]])
+
+            return op in ancestors[j]
+
+        reachable = {}
+
+        for idx, t_idx in enumerate(self._trainable_idx.tolist()):
+            grad_method = self._par_grad_method
+
+            if grad_method is not None and grad_method[t_idx] == GradMethod.ZERO:
+                # independent parameter; the gradient is zero and is not required
+                continue
+
+            op = self._par_ops[t_idx]
+
+            # The reversible tape only supports the RX, RY, RZ, and Rot operations for now:
+            #
+            # * CRX, CRY, CRZ ops have a non-unitary matrix as generator.
+            #
+            # * PauliRot, MultiRZ, U2, and U3 do not have generators specified.
+            #
+            # TODO: the controlled rotations can be supported by multiplying ``state``
+            # directly by these generators within this function
+            # (or by allowing non-unitary matrix multiplies in the simulator backends)
+
+            if op.name not in ["RX", "RY", "RZ", "Rot"]:
+                raise ValueError(
+                    "The {} gate is not currently supported with the "
+                    "reversible gradient method.".format(op.name)
+                )
+
+            if op.name == "Rot":
+                rot_decompositions.setdefault(op, op.decomposition(*op.parameters, wires=op.wires))
+
+            if param_indices is not None and idx not in param_indices:
+                continue
+
+            reachable[idx] = [affects(op, j) for j in range(len(observables))]
+            diff_gates.append((op, int(self._par_p_idx[t_idx]), idx))
+
+        positions = {}
+
+        for op in self.operations:
+            if op in rot_decompositions:
+                positions[op] = len(ops)
+                ops.extend(rot_decompositions[op])
+            else:
+                positions[op] = len(ops)
+                ops.append(op)
+
+        sweep = []
+
+        for op, p_idx, idx in diff_gates:
+            pos = positions[op]
+
+            if op.name == "Rot":
+                pos += p_idx
+                op = rot_decompositions[op][p_idx]
+
+            generator, multiplier = op.generator
+            axes = tuple(device.wires.indices(op.wires))
+            sweep.append((pos, generator.__name__, axes, multiplier, idx))
+
+        if not sweep:
+            return
+
+        sweep.sort(key=lambda x: x[0], reverse=True)
+
+        dtype = dtype or device.C_DTYPE
+        state = device._cast(self._state, dtype=dtype)
+        observables = self.observables
+        num_obs = len(observables)
+
+        # The batch consists of the pre-measurement state, followed by the observables
+        # applied to the pre-measurement state. It is rewound from the end of the
+        # circuit; ops[:applied] have been applied.
+        obs_states = self._apply_observables(state, observables, device, dtype=dtype)
+        batch = device._stack([state] + list(obs_states))
+        applied = len(ops)
+
+        # the matrix elements of all parameters are written into a single buffer
+        matrix_elems = np.empty([len(sweep), num_obs], dtype=dtype)
+
+        for k, (pos, generator, axes, _, _) in enumerate(sweep):
+            # rewind the batch to just after the differentiated gate
+            rewind_ops = ops[pos + 1 : applied]
+            batch = self._evolve(batch, rewind_ops, device, batched=True, dtype=dtype, inverse=True)
+            applied = pos + 1
+
+            # compute the matrix elements <d(state)|O|state> for each observable O
+            dstate = self._apply_generator(batch[0], generator, axes, device, dtype=dtype)
+            dstate = device._reshape(device._conj(dstate), [-1])
+            np.dot(device._reshape(batch[1:], [num_obs, -1]), dstate, out=matrix_elems[k])
+
+        multipliers = np.array([[multiplier] for _, _, _, multiplier, _ in sweep])
+        pd = 2 * multipliers * matrix_elems.imag
+
+        # observables that do not depend on a gate have a zero partial derivative
+        mask = np.array([reachable[idx] for _, _, _, _, idx in sweep], dtype=bool)
+        pd = device._cast(np.where(mask, pd, 0), dtype=device.R_DTYPE)
+
+        for k, (_, _, _, _, idx) in enumerate(sweep):
+            self._pd[idx] = pd[k]
+
+        # reset state back to pre-measurement value
+        device._pre_rotated_state = self._state
 
     def analytic_pd(self, idx, device, params=None, **options):
-        t_idx = list(self.trainable_params)[idx]
-        op = self._par_info[t_idx]["op"]
-        p_idx = self._par_info[t_idx]["p_idx"]
+        """Partial derivative of expectation values with respect to a single
+        trainable parameter, computed using reversible analytic differentiation.
+
+        On the first call during a Jacobian evaluation, the partial derivatives of all
+        trainable parameters are computed in a single reverse sweep, and cached.
 
+        Args:
+            idx (int): trainable parameter index to differentiate with respect to
+            device (.QubitDevice): a statevector simulator device
+            params (list[Any]): the quantum tape operation parameters
+
+        Keyword Args:
+            grad_precision="double" (str): The precision of the statevector arithmetic
+                used to compute the gradient
+            k_params=None (int): The number of trainable parameters to sample
+                and differentiate
+            seed=None (int or numpy.random.Generator): Seed or random number generator
+                used to sample the ``k_params`` differentiated parameters
+
+        See :class:`~.ReversibleTape` for more details on these options.
+
+        Returns:
+            array[float]: 1-dimensional array of length determined by the tape output
+            measurement statistics
+        """
         # The reversible tape only support differentiating
         # expectation values of observables for now.
         for m in self.measurements:
@@ -141,64 +729,48 @@ class ReversibleTape(QuantumTape):
                     f"{m.return_type} is not supported with the reversible gradient method"
                 )
 
-        # The reversible tape only supports the RX, RY, RZ, and Rot operations for now:
-        #
-        # * CRX, CRY, CRZ ops have a non-unitary matrix as generator.
-        #
-        # * PauliRot, MultiRZ, U2, and U3 do not have generators specified.
-        #
-        # TODO: the controlled rotations can be supported by multiplying ``state``
-        # directly by these generators within this function
-        # (or by allowing non-unitary matrix multiplies in the simulator backends)
-
-        if op.name not in ["RX", "RY", "RZ", "Rot"]:
+        grad_precision = options.get("grad_precision", "double")
+
+        if grad_precision not in _GRAD_PRECISION_DTYPES:
             raise ValueError(
-                "The {} gate is not currently supported with the "
-                "reversible gradient method.".format(op.name)
+                "Unknown gradient precision {}; must be one of {}".format(
+                    grad_precision, list(_GRAD_PRECISION_DTYPES)
+                )
             )
 
+        k_params = options.get("k_params", None)
+
+        if k_params is not None and (
+            isinstance(k_params, bool) or not isinstance(k_params, numbers.Integral) or k_params < 1
+        ):
+            raise ValueError(f"k_params must be a positive integer; got {k_params!r}")
+
         if self._state is None:
             self.execute_device(params, device)
             self._state = device._pre_rotated_state
 
-        self.set_parameters(params)
-
-        # create a new circuit which rewinds the pre-measurement state to just after `op`,
-        # applies the generator of `op`, and then plays forward back to
-        # pre-measurement step
-        wires = op.wires
-        op_idx = self.operations.index(op)
-
-        # TODO: likely better to use circuitgraph to determine minimally necessary ops
-        between_ops = self.operations[op_idx + 1 :]
+            param_indices = None
 
-        if op.name == "Rot":
-            decomp = op.decomposition(*op.parameters, wires=wires)
-            generator, multiplier = decomp[p_idx].generator
-            between_ops = decomp[p_idx + 1 :] + between_ops
-        else:
-            generator, multiplier = op.generator
-
-        generator = generator(wires)
-
-        diff_circuit = QuantumTape()
-        diff_circuit._ops = [copy(op).inv() for op in between_ops[::-1]] + [generator] + between_ops
-
-        # set the simulator state to be the pre-measurement state
-        device._state = self._state
-
-        # evolve the pre-measurement state under this new circuit
-        device.execute(diff_circuit)
-        dstate = device._pre_rotated_state  # TODO: this will only work for QubitDevices
+            if k_params is not None:
+                # sample from the parameters that are not independent
+                candidates = np.flatnonzero(
+                    self._par_grad_method[self._trainable_idx] != GradMethod.ZERO
+                )
+                rng = np.random.default_rng(options.get("seed", None))
+                param_indices = rng.choice(
+                    candidates, min(k_params, len(candidates)), replace=False
+                )
+                param_indices = set(param_indices.tolist())
 
-        # compute matrix element <d(state)|O|state> for each observable O
-        matrix_elems = device._asarray(
-            [self._matrix_elem(dstate, ob, self._state, device) for ob in self.observables]
-            # TODO: if all observables act on same number of wires, could
-            # do all at once with einsum
-        )
+            self.set_parameters(params)
+            self._reverse_sweep(
+                device,
+                dtype=_GRAD_PRECISION_DTYPES[grad_precision],
+                param_indices=param_indices,
+            )
 
-        # reset state back to pre-measurement value
-        device._pre_rotated_state = self._state
+        if idx not in self._pd:
+            # the parameter was not sampled
+            return np.zeros([len(self.observables)], dtype=device.R_DTYPE)
 
-        return 2 * multiplier * device._imag(matrix_elems)
+        return self._pd[idx]
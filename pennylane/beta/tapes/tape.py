@@ -15,8 +15,13 @@
 This module contains the base quantum tape.
 """
 # pylint: disable=too-many-instance-attributes,protected-access,too-many-branches,too-many-public-methods
-from collections import OrderedDict
+from collections import OrderedDict, deque
+import concurrent.futures
 import contextlib
+import copy
+from enum import IntEnum
+import struct
+import threading
 
 import numpy as np
 
@@ -43,6 +48,71 @@ STATE_PREP_OPS = (
 )
 
 
+GRAD_METHODS = (None, "0", "F", "A", "A2")
+"""tuple[str or None]: Supported parameter gradient methods. The position of each
+method in this tuple is the integer code stored in ``QuantumTape._par_grad_method``."""
+
+
+class GradMethod(IntEnum):
+    """Integer codes of the parameter gradient methods in :data:`GRAD_METHODS`,
+    as stored in the ``np.uint8`` array ``QuantumTape._par_grad_method``."""
+
+    NONE = 0
+    ZERO = 1
+    F = 2
+    A = 3
+    A2 = 4
+
+    @property
+    def label(self):
+        """str or None: the gradient method string corresponding to this code"""
+        return GRAD_METHODS[self]
+
+
+_GRAD_METHOD_CODES = {method: GradMethod(code) for code, method in enumerate(GRAD_METHODS)}
+
+_TAPE_QUEUES = ("_prep", "_ops", "_measurements")
+
+# 64-bit FNV-1a parameters, used by QuantumTape.hash
+_FNV_OFFSET_BASIS = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+_DOUBLE = struct.Struct("<d")
+_UINT64 = struct.Struct("<Q")
+
+
+def _parameter_hash(p):
+    """Hash of an operator parameter, for use in :attr:`QuantumTape.hash`.
+
+    Real scalars are hashed by the bit pattern of their double-precision value,
+    and arrays by their shape, dtype, and contents. Parameters that cannot be
+    converted to a double or a numeric NumPy array (such as integers too large for
+    a double, or symbolic tensors) cannot be hashed by value.
+
+    Args:
+        p (Any): the parameter
+
+    Returns:
+        int or None: the parameter hash, or ``None`` if the parameter cannot be hashed
+    """
+    try:
+        if isinstance(p, (float, int)):
+            return _UINT64.unpack(_DOUBLE.pack(p))[0]
+
+        p = np.asarray(p)
+    except (struct.error, TypeError, ValueError, NotImplementedError, RuntimeError):
+        # struct.error is raised for integers too large for a double, and
+        # RuntimeError when converting tensors that require gradients
+        return None
+
+    if p.dtype.hasobject:
+        # object arrays contain references rather than values
+        return None
+
+    return hash((p.shape, p.dtype.str, p.tobytes()))
+
+
 def expand_tape(tape, depth=1, stop_at=None, expand_measurements=False):
     """Expand all objects in a tape to a specific depth.
 
@@ -96,19 +166,55 @@ def expand_tape(tape, depth=1, stop_at=None, expand_measurements=False):
         # by default expand all objects
         stop_at = lambda obj: False
 
+    def stops(obj):
+        """Returns ``True`` if the object should not be expanded."""
+        if stop_at(obj):
+            return True
+
+        if not expand_measurements and isinstance(obj, qml.beta.queuing.MeasurementProcess):
+            # Measurements should not be expanded; treat measurements
+            # as a stopping condition
+            return True
+
+        # Objects that do not define a decomposition are treated as a
+        # stopping condition, without constructing their expansion.
+        return isinstance(obj, qml.operation.Operation) and not obj.has_decomposition
+
     new_tape = tape.__class__()
 
-    for queue in ("_prep", "_ops", "_measurements"):
-        for obj in getattr(tape, queue):
+    if all(stops(obj) for queue in _TAPE_QUEUES for obj in getattr(tape, queue)):
+        # None of the objects are to be expanded; this is the common case when the tape
+        # only contains supported operations. Avoid monkeypatching the operations and
+        # walking the tape, and simply copy the queues.
+        for queue in _TAPE_QUEUES:
+            setattr(new_tape, queue, getattr(tape, queue).copy())
+
+        return new_tape
+
+    # Objects still to be processed, as (object, queue, remaining depth) triples.
+    # Expansions are processed depth-first, with the expanded objects placed at the
+    # front of the worklist, so that the expanded tape preserves the object order
+    # without constructing intermediate expanded tapes at each depth.
+    worklist = deque((obj, queue, depth) for queue in _TAPE_QUEUES for obj in getattr(tape, queue))
+
+    with contextlib.ExitStack() as stack:
+        if not QueuingContext.recording():
+            # Operations and measurements record their expansions on new tapes.
+            # Monkeypatch the operations and enter a scratch queuing context once
+            # for the whole expansion, rather than once per expanded object.
+            for mock in mock_operations():
+                stack.enter_context(mock)
+
+            stack.enter_context(AnnotatedQueue())
 
-            stop = stop_at(obj)
+        while worklist:
+            obj, queue, depth = worklist.popleft()
 
-            if not expand_measurements:
-                # Measurements should not be expanded; treat measurements
-                # as a stopping condition
-                stop = stop or isinstance(obj, qml.beta.queuing.MeasurementProcess)
+            if depth == 0:
+                getattr(new_tape, queue).append(obj)
+                continue
 
-            if stop:
+            if stops(obj):
                 # do not expand out the object; append it to the
                 # new tape, and continue to the next object in the queue
                 getattr(new_tape, queue).append(obj)
@@ -124,12 +230,12 @@ def expand_tape(tape, depth=1, stop_at=None, expand_measurements=False):
                     getattr(new_tape, queue).append(obj)
                     continue
 
-            # recursively expand out the newly created tape
-            expanded_tape = expand_tape(obj, stop_at=stop_at, depth=depth - 1)
-
-            new_tape._prep += expanded_tape._prep
-            new_tape._ops += expanded_tape._ops
-            new_tape._measurements += expanded_tape._measurements
+            # queue the contents of the expanded (or nested) tape for expansion
+            worklist.extendleft(
+                (child, q, depth - 1)
+                for q in reversed(_TAPE_QUEUES)
+                for child in reversed(getattr(obj, q))
+            )
 
     return new_tape
 
@@ -238,21 +344,56 @@ class QuantumTape(AnnotatedQueue):
         self._measurements = []
         """list[.MeasurementProcess]: measurement processes recorded by the tape."""
 
-        self._par_info = {}
-        """dict[int, dict[str, Operation or int]]: Parameter information. Keys are
-        parameter indices (in the order they appear on the tape), and values are a
-        dictionary containing the corresponding operation and operation parameter index."""
+        self._par_ops = []
+        """list[.Operation]: The operation corresponding to each tape parameter, in the
+        order the parameters appear on the tape."""
+
+        self._par_p_idx = np.zeros(0, dtype=np.int32)
+        """array[int]: The index of each tape parameter within its operation's parameters."""
+
+        self._par_grad_method = None
+        """array[int] or None: The gradient method of each tape parameter, encoded as an
+        index into :data:`GRAD_METHODS`. ``None`` if gradient information has not yet
+        been generated."""
+
+        self._par_grad_method_mask = None
+        """array[bool] or None: Boolean mask over all tape parameters, indicating which
+        entries of ``_par_grad_method`` have been computed. ``None`` if gradient information
+        has not yet been generated."""
 
         self._trainable_params = set()
+        """set[int]: Indices of the trainable parameters."""
+
+        self._trainable_mask = np.zeros(0, dtype=bool)
+        """array[bool]: Boolean mask over all tape parameters, indicating which
+        parameters are trainable."""
+
+        self._trainable_idx = np.zeros(0, dtype=np.int32)
+        """array[int]: Indices of the trainable parameters, in order of appearance on the tape.
+        Equal to ``np.flatnonzero(self._trainable_mask)``, and updated alongside it."""
+
+        self._measurement_wires_mask = np.zeros(0, dtype=np.uint64)
+        """array[int] or None: Bitmask of the wires each measurement acts on; bit ``i``
+        is set if the measurement acts on ``self.wires[i]``. ``None`` if the tape
+        acts on more than 64 wires."""
+
         self._graph = None
         self._output_dim = 0
 
+        self._diagonalizing_gates_cache = None
+        """tuple[list, list[.Operation]] or None: The tape observables (together with
+        the identities of their parameters) that the diagonalizing gates were last
+        constructed for, and the corresponding diagonalizing gates."""
+
+        self._graph_cache = {}
+        """dict[tuple, .NewCircuitGraph]: Circuit graphs previously constructed for this tape,
+        keyed by the circuit structure they represent."""
+
         self.wires = qml.wires.Wires([])
         self.num_wires = 0
 
         self.jacobian_options = {}
 
-        self.hash = 0
         self.is_sampled = False
 
         self._stack = None
@@ -265,6 +406,21 @@ class QuantumTape(AnnotatedQueue):
         """OrderedDict[int: Any]: Mapping from hashes of the circuit to results of executing the 
         device."""
 
+        self._record_execution = False
+        """bool: whether :meth:`~.execute_device` should record its result as the last
+        execution. Only set during calls to :meth:`~.execute`, if the Jacobian options
+        make use of the unshifted result (see :meth:`~._uses_unshifted_result`)."""
+
+        self._parallel_execution = None
+        """tuple[.Device, ThreadPoolExecutor, threading.local] or None: the device, thread pool,
+        and per-thread worker copies shared by all parallel executions within a
+        :meth:`~._parallel_pool` context."""
+
+        self._last_execution = None
+        """tuple[.Device, list, int, array] or None: the device, parameters, circuit hash,
+        and result of the last recorded execution via :meth:`~.execute` on an analytic
+        device. Used by :meth:`~.jacobian` to avoid re-evaluating the unshifted circuit."""
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: wires={self.wires.tolist()}, params={self.num_params}>"
 
@@ -306,15 +462,14 @@ class QuantumTape(AnnotatedQueue):
 
         * ``_ops``
         * ``_measurements``
-        * ``_par_info``
+        * ``_par_ops``, ``_par_p_idx``, and ``_par_grad_method``
         * ``_output_dim``
-        * ``_trainable_params``
+        * ``_trainable_params``, ``_trainable_mask``, and ``_trainable_idx``
         * ``is_sampled``
         """
         self._prep = []
         self._ops = []
         self._measurements = []
-        self._output_dim = 0
 
         for obj, info in self._queue.items():
 
@@ -346,18 +501,6 @@ class QuantumTape(AnnotatedQueue):
                 # measurement process
                 self._measurements.append(obj)
 
-                # attempt to infer the output dimension
-                if obj.return_type is qml.operation.Probability:
-                    self._output_dim += 2 ** len(obj.wires)
-                elif obj.return_type is qml.operation.State:
-                    continue  # the output_dim is worked out automatically
-                else:
-                    self._output_dim += 1
-
-                # check if any sampling is occuring
-                if obj.return_type is qml.operation.Sample:
-                    self.is_sampled = True
-
             elif isinstance(obj, qml.operation.Observable) and "owner" not in info:
                 raise ValueError(f"Observable {obj} does not have a measurement type specified.")
 
@@ -370,22 +513,76 @@ class QuantumTape(AnnotatedQueue):
         )
         self.num_wires = len(self.wires)
 
+        # check if any sampling is occuring
+        self.is_sampled = any(m.return_type is qml.operation.Sample for m in self._measurements)
+
+        # attempt to infer the output dimension
+        output_dim = 0
+
+        for m in self._measurements:
+            if m.return_type is qml.operation.Probability:
+                output_dim += 1 << len(m.wires)
+            elif m.return_type is not State:
+                # the output_dim of the state is worked out automatically
+                output_dim += 1
+
+        self._output_dim = output_dim
+
+        if self.num_wires > 64:
+            self._measurement_wires_mask = None
+            return
+
+        wire_bits = {w: 1 << i for i, w in enumerate(self.wires.labels)}
+        all_wires = (1 << self.num_wires) - 1
+        masks = []
+
+        for m in self._measurements:
+            # measurements without wires (such as the state) act on all wires
+            wires = m.wires.labels
+            masks.append(sum(wire_bits[w] for w in wires) if wires else all_wires)
+
+        self._measurement_wires_mask = np.array(masks, dtype=np.uint64)
+
     def _update_par_info(self):
-        """Update the parameter information dictionary"""
-        param_count = 0
+        """Update the parameter information arrays"""
+        par_ops = []
+        par_p_idx = []
 
         for obj in self.operations + self.observables:
+            num_obj_params = len(obj.data)
+            par_ops.extend([obj] * num_obj_params)
+            par_p_idx.extend(range(num_obj_params))
 
-            for p in range(len(obj.data)):
-                info = self._par_info.get(param_count, {})
-                info.update({"op": obj, "p_idx": p})
+        self._par_ops = par_ops
+        self._par_p_idx = np.array(par_p_idx, dtype=np.int32)
+        self._par_grad_method = None
+        self._par_grad_method_mask = None
 
-                self._par_info[param_count] = info
-                param_count += 1
+    @property
+    def _par_info(self):
+        """dict[int, dict[str, Operation or int]]: Parameter information. Keys are
+        parameter indices (in the order they appear on the tape), and values are a
+        dictionary containing the corresponding operation, operation parameter index,
+        and (if already generated) gradient method.
+
+        This is a view constructed on demand from the parameter information arrays;
+        modifying it does not modify the tape.
+        """
+        par_info = {}
+
+        for idx, (op, p_idx) in enumerate(zip(self._par_ops, self._par_p_idx.tolist())):
+            par_info[idx] = {"op": op, "p_idx": p_idx}
+
+            if self._par_grad_method is not None:
+                par_info[idx]["grad_method"] = GRAD_METHODS[self._par_grad_method[idx]]
+
+        return par_info
 
     def _update_trainable_params(self):
         """Set the trainable parameters"""
-        self._trainable_params = set(self._par_info)
+        self._trainable_params = set(range(len(self._par_ops)))
+        self._trainable_mask = np.ones(len(self._par_ops), dtype=bool)
+        self._trainable_idx = np.arange(len(self._par_ops), dtype=np.int32)
 
     def _update(self):
         """Update all internal tape metadata regarding processed operations and observables"""
@@ -501,42 +698,37 @@ class QuantumTape(AnnotatedQueue):
         >>> tape.trainable_params
         {1, 4}
         """
-        # we must remap the old parameter
-        # indices to the new ones after the operation order is reversed.
-        parameter_indices = []
-        param_count = 0
-
-        for queue in [self._prep, self._ops, self.observables]:
-            # iterate through all queues
-
-            obj_params = []
-
-            for obj in queue:
-                # index the number of parameters on each operation
-                num_obj_params = len(obj.data)
-                obj_params.append(list(range(param_count, param_count + num_obj_params)))
-
-                # keep track of the total number of parameters encountered so far
-                param_count += num_obj_params
-
-            if queue == self._ops:
-                # reverse the list representing operator parameters
-                obj_params = obj_params[::-1]
-
-            parameter_indices.extend(obj_params)
-
-        # flatten the list of parameter indices after the reversal
-        parameter_indices = [item for sublist in parameter_indices for item in sublist]
-        parameter_mapping = dict(zip(parameter_indices, range(len(parameter_indices))))
-
-        # map the params
-        self.trainable_params = {parameter_mapping[i] for i in self.trainable_params}
-        self._par_info = {parameter_mapping[k]: v for k, v in self._par_info.items()}
+        # Only the parameters of the (non state preparation) operations are
+        # reordered; these form a contiguous block of the tape parameters.
+        start = sum(len(op.data) for op in self._prep)
+        stop = start + sum(len(op.data) for op in self._ops)
+
+        # Reversing the block reverses the order of the operations, but also the
+        # order of the parameters within each operation. Old parameter
+        # i = offset + p of an operation with n parameters must therefore be
+        # moved to reversed position j such that
+        # permutation[j] = reversed[j] + n - 1 - 2 * p.
+        permutation = np.arange(len(self._par_ops))
+        block = permutation[start:stop][::-1]
+        num_op_params = np.array([len(self._par_ops[i].data) for i in block.tolist()], dtype=int)
+        permutation[start:stop] = block + num_op_params - 1 - 2 * self._par_p_idx[block]
+
+        # the new parameter at position j is the old parameter permutation[j]
+        self._par_ops = [self._par_ops[i] for i in permutation.tolist()]
+        self._par_p_idx = self._par_p_idx[permutation]
+        self._trainable_mask = self._trainable_mask[permutation]
+        self._trainable_idx = np.flatnonzero(self._trainable_mask).astype(np.int32)
+        self._trainable_params = set(self._trainable_idx.tolist())
+
+        if self._par_grad_method is not None:
+            self._par_grad_method = self._par_grad_method[permutation]
+            self._par_grad_method_mask = self._par_grad_method_mask[permutation]
 
         for op in self._ops:
             op.inverse = not op.inverse
 
-        self._ops = list(reversed(self._ops))
+        self._ops.reverse()
+        self._graph = None
 
     # ========================================================
     # Parameter handling
@@ -598,10 +790,13 @@ class QuantumTape(AnnotatedQueue):
         if any(not isinstance(i, int) or i < 0 for i in param_indices):
             raise ValueError("Argument indices must be positive integers.")
 
-        if any(i > len(self._par_info) for i in param_indices):
+        if any(i >= len(self._par_ops) for i in param_indices):
             raise ValueError(f"Tape has at most {self.num_params} parameters.")
 
-        self._trainable_params = param_indices
+        self._trainable_params = set(param_indices)
+        self._trainable_mask = np.zeros(len(self._par_ops), dtype=bool)
+        self._trainable_mask[list(self._trainable_params)] = True
+        self._trainable_idx = np.flatnonzero(self._trainable_mask).astype(np.int32)
 
     def get_parameters(self, trainable_only=True):
         """Return the parameters incident on the tape operations.
@@ -644,15 +839,15 @@ class QuantumTape(AnnotatedQueue):
         >>> tape.get_parameters(trainable_only=False)
         [0.432, 0.543, 0.133]
         """
-        params = []
-        iterator = self.trainable_params if trainable_only else self._par_info
+        ops = self._par_ops
+        p_idx = self._par_p_idx.tolist()
 
-        for p_idx in iterator:
-            op = self._par_info[p_idx]["op"]
-            op_idx = self._par_info[p_idx]["p_idx"]
-            params.append(op.data[op_idx])
+        if trainable_only:
+            iterator = self._trainable_idx.tolist()
+        else:
+            iterator = range(len(ops))
 
-        return params
+        return [ops[i].data[p_idx[i]] for i in iterator]
 
     def set_parameters(self, params, trainable_only=True):
         """Set the parameters incident on the tape operations.
@@ -700,18 +895,20 @@ class QuantumTape(AnnotatedQueue):
         [4, 1, 6]
         """
         if trainable_only:
-            iterator = zip(self.trainable_params, params)
+            iterator = zip(self._trainable_idx.tolist(), params)
             required_length = self.num_params
         else:
             iterator = enumerate(params)
-            required_length = len(self._par_info)
+            required_length = len(self._par_ops)
 
         if len(params) != required_length:
             raise ValueError("Number of provided parameters does not match.")
 
+        ops = self._par_ops
+        p_idx = self._par_p_idx.tolist()
+
         for idx, p in iterator:
-            op = self._par_info[idx]["op"]
-            op.data[self._par_info[idx]["p_idx"]] = p
+            ops[idx].data[p_idx[idx]] = p
 
     # ========================================================
     # Tape properties
@@ -807,10 +1004,66 @@ class QuantumTape(AnnotatedQueue):
         """
         return self._measurements
 
+    def measurements_on_wire(self, wire):
+        """Returns the measurements on the quantum tape that act on a given wire.
+
+        Measurements that do not specify any wires, such as the returned state,
+        act on all wires.
+
+        Args:
+            wire (Number or str): the wire label
+
+        Returns:
+            list[.MeasurementProcess]: the measurements acting on the wire, in the
+            order they appear on the tape
+
+        **Example**
+
+        .. code-block:: python
+
+            from pennylane.beta.tapes import QuantumTape
+            from pennylane.beta.queuing import expval, probs
+
+            with QuantumTape() as tape:
+                qml.CNOT(wires=[0, 'a'])
+                expval(qml.PauliZ(wires=[0]))
+                probs(wires=['a'])
+
+        >>> [m.return_type for m in tape.measurements_on_wire('a')]
+        [probs]
+        """
+        if wire not in self.wires.labels:
+            return []
+
+        if self._measurement_wires_mask is None:
+            return [m for m in self._measurements if wire in (m.wires.labels or (wire,))]
+
+        bit = np.uint64(1 << self.wires.index(wire))
+        idx = np.flatnonzero(self._measurement_wires_mask & bit)
+        return [self._measurements[i] for i in idx]
+
     @property
     def num_params(self):
         """Returns the number of trainable parameters on the quantum tape."""
-        return len(self.trainable_params)
+        return int(np.count_nonzero(self._trainable_mask))
+
+    @property
+    def trainable_grad_method_counts(self):
+        """dict[str or None, int]: The number of trainable parameters using each
+        parameter gradient method. Gradient information is generated if it
+        has not already been.
+
+        **Example**
+
+        >>> tape.trainable_grad_method_counts
+        {None: 0, '0': 1, 'F': 0, 'A': 2, 'A2': 0}
+        """
+        if self._gradient_info_outdated():
+            self._update_gradient_info()
+
+        codes = self._par_grad_method[self._trainable_mask]
+        counts = np.bincount(codes, minlength=len(GRAD_METHODS))
+        return dict(zip(GRAD_METHODS, counts.tolist()))
 
     @property
     def output_dim(self):
@@ -824,13 +1077,30 @@ class QuantumTape(AnnotatedQueue):
 
         Returns:
             List[~.Operation]: the operations that diagonalize the observables
+
+        The diagonalizing gates are cached, and only reconstructed if the tape
+        observables, or their parameters, have changed since the last call.
         """
+        observables = self.observables
+
+        # The observables themselves are stored in the key; this keeps them
+        # alive, so that their ids cannot be reused by other objects.
+        key = [(ob, [id(p) for p in ob.data]) for ob in observables]
+        cache = self._diagonalizing_gates_cache
+
+        if cache is not None and len(cache[0]) == len(key):
+            if all(
+                ob1 is ob2 and data1 == data2 for (ob1, data1), (ob2, data2) in zip(cache[0], key)
+            ):
+                return list(cache[1])
+
         rotation_gates = []
 
-        for observable in self.observables:
+        for observable in observables:
             rotation_gates.extend(observable.diagonalizing_gates())
 
-        return rotation_gates
+        self._diagonalizing_gates_cache = (key, rotation_gates)
+        return list(rotation_gates)
 
     @property
     def graph(self):
@@ -841,16 +1111,106 @@ class QuantumTape(AnnotatedQueue):
         <pennylane.beta.tapes.circuit_graph.NewCircuitGraph object at 0x7fcc0433a690>
 
         Note that the circuit graph is only constructed once, on first call to this property,
-        and cached for future use.
+        and cached for future use. The cache is keyed by the structure of the circuit;
+        if the tape is updated, the graph is only reconstructed if the structure has changed.
 
         Returns:
             .beta.tapes.NewCircuitGraph: the circuit graph object
         """
         if self._graph is None:
-            self._graph = NewCircuitGraph(self.operations, self.observables, self.wires)
+            key = self._graph_key()
+            self._graph = self._graph_cache.get(key, None)
+
+            if self._graph is None:
+                self._graph = NewCircuitGraph(self.operations, self.observables, self.wires)
+                self._graph_cache[key] = self._graph
 
         return self._graph
 
+    def _graph_key(self):
+        """Structural key of the circuit represented by the tape, used to cache the circuit graph.
+
+        The graph nodes are the operation and observable objects themselves, so the
+        key consists of the identity and wires of each object, in order. Since the cached
+        graphs hold references to these objects, their identities cannot be reused while
+        the corresponding cache entry exists.
+
+        Returns:
+            tuple: the structural key
+        """
+        return tuple(
+            (id(obj), tuple(obj.wires.tolist())) for obj in self.operations + self.observables
+        )
+
+    @property
+    def hash(self):
+        """int or None: A 64-bit hash of the circuit represented by the tape.
+
+        The hash is a rolling FNV-1a hash over the name, wires, and parameter values of
+        each operation, and the return type, name, wires, and parameter values of each
+        measurement, in order. Tapes representing the same circuit have the same hash,
+        even if they contain different operation objects.
+
+        If the tape contains parameters that cannot be hashed by value, such as
+        symbolic tensors, the hash is ``None`` and executions of the tape are not cached.
+
+        **Example**
+
+        >>> with QuantumTape() as tape:
+        ...     qml.RX(0.432, wires=0)
+        ...     expval(qml.PauliZ(wires=0))
+        >>> with QuantumTape() as tape2:
+        ...     qml.RX(0.432, wires=0)
+        ...     expval(qml.PauliZ(wires=0))
+        >>> tape.hash == tape2.hash
+        True
+        >>> tape2.set_parameters([0.1])
+        >>> tape.hash == tape2.hash
+        False
+        """
+        h = _FNV_OFFSET_BASIS
+
+        for op in self.operations:
+            if isinstance(op, QuantumTape):
+                op_hash = op.hash
+
+                if op_hash is None:
+                    return None
+
+                h = ((h ^ op_hash) * _FNV_PRIME) & _UINT64_MASK
+                continue
+
+            h = ((h ^ hash(op.name)) * _FNV_PRIME) & _UINT64_MASK
+            h = ((h ^ hash(op.wires.labels)) * _FNV_PRIME) & _UINT64_MASK
+
+            for p in op.data:
+                p_hash = _parameter_hash(p)
+
+                if p_hash is None:
+                    return None
+
+                h = ((h ^ p_hash) * _FNV_PRIME) & _UINT64_MASK
+
+        for m in self._measurements:
+            h = ((h ^ hash(m.return_type)) * _FNV_PRIME) & _UINT64_MASK
+
+            # measurements without an observable are specified by their wires only
+            obs = [m] if m.obs is None else getattr(m.obs, "obs", [m.obs])
+
+            for ob in obs:
+                h = ((h ^ hash(ob.name)) * _FNV_PRIME) & _UINT64_MASK
+                h = ((h ^ hash(ob.wires.labels)) * _FNV_PRIME) & _UINT64_MASK
+
+                for p in ob.data:
+                    p_hash = _parameter_hash(p)
+
+                    if p_hash is None:
+                        return None
+
+                    h = ((h ^ p_hash) * _FNV_PRIME) & _UINT64_MASK
+
+        return h
+
     @property
     def data(self):
         """Alias to :meth:`~.get_parameters` and :meth:`~.set_parameters`
@@ -861,16 +1221,44 @@ class QuantumTape(AnnotatedQueue):
     def data(self, params):
         self.set_parameters(params, trainable_only=False)
 
-    def copy(self):
-        """Returns a shallow copy of the quantum tape."""
+    def copy(self, copy_operations=False):
+        """Returns a shallow copy of the quantum tape.
+
+        Args:
+            copy_operations (bool): If True, the tape operations and measurements are also
+                shallowly copied. Otherwise, the copied tape will contain the same operation
+                objects as the original tape, and setting the parameters of one will also
+                set the parameters of the other.
+
+        Returns:
+            .QuantumTape: a shallow copy of the tape
+        """
         tape = self.__class__()
-        tape._prep = self._prep.copy()
-        tape._ops = self._ops.copy()
-        tape._measurements = self._measurements.copy()
+
+        if copy_operations:
+            # Perform a shallow copy of all operations in the state prep, operation, and
+            # measurement queues. The operations will continue to share parameter values
+            # with the original tape operations, but not the parameter lists themselves.
+            tape._prep = [copy.copy(op) for op in self._prep]
+            tape._ops = [
+                op.copy(copy_operations=True) if isinstance(op, QuantumTape) else copy.copy(op)
+                for op in self._ops
+            ]
+            tape._measurements = [copy.copy(m) for m in self._measurements]
+        else:
+            tape._prep = self._prep.copy()
+            tape._ops = self._ops.copy()
+            tape._measurements = self._measurements.copy()
+
+            # the copied tape contains the same objects; the circuit graphs can be shared
+            tape._graph_cache = self._graph_cache
 
         tape._update()
 
-        tape._par_info = self._par_info.copy()
+        if self._par_grad_method is not None:
+            tape._par_grad_method = self._par_grad_method.copy()
+            tape._par_grad_method_mask = self._par_grad_method_mask.copy()
+
         tape.trainable_params = self.trainable_params.copy()
         return tape
 
@@ -921,7 +1309,12 @@ class QuantumTape(AnnotatedQueue):
         if params is None:
             params = self.get_parameters()
 
-        return self._execute(params, device=device)
+        self._record_execution = self._uses_unshifted_result()
+
+        try:
+            return self._execute(params, device=device)
+        finally:
+            self._record_execution = False
 
     def execute_device(self, params, device):
         """Execute the tape on a quantum device.
@@ -946,14 +1339,23 @@ class QuantumTape(AnnotatedQueue):
         # temporarily mutate the in-place parameters
         self.set_parameters(params)
 
-        if self._caching:
-            circuit_hash = self.graph.hash
-            if circuit_hash in self._cache_execute:
-                self.set_parameters(saved_parameters)
-                return self._cache_execute[circuit_hash]
+        # Record the result, so that a subsequent Jacobian computation at the
+        # same parameters (such as the backward pass of an optimization step)
+        # can reuse it rather than executing the unshifted circuit again.
+        record = self._record_execution and getattr(device, "analytic", False)
+        qubit_device = isinstance(device, qml.QubitDevice)
+
+        # tapes that cannot be hashed are not cached
+        circuit_hash = self.hash if self._caching else None
+        caching = circuit_hash is not None
+
+        if caching and circuit_hash in self._cache_execute:
+            self.set_parameters(saved_parameters)
+            return self._cache_execute[circuit_hash]
 
-        if isinstance(device, qml.QubitDevice):
-            res = device.execute(self)
+        if qubit_device:
+            # the circuit is only hashed if required by the cache or the record
+            res = device.execute(self, circuit_hash=circuit_hash)
         else:
             res = device.execute(self.operations, self.observables, {})
 
@@ -961,10 +1363,13 @@ class QuantumTape(AnnotatedQueue):
         # Note that we cannot assume the type of `res`, so
         # we use duck typing to catch any 'array like' object.
         try:
-            if isinstance(res, np.ndarray) and res.dtype is np.dtype("object"):
-                output_dim = sum([len(i) for i in res])
-            else:
+            if not isinstance(res, np.ndarray):
                 output_dim = np.prod(res.shape)
+            elif res.dtype is np.dtype("object"):
+                output_dim = sum(len(i) for i in res)
+            else:
+                # avoid constructing an intermediate array from the shape
+                output_dim = res.size
 
             if self.output_dim != output_dim:
                 # update the inferred output dimension with the correct value
@@ -974,10 +1379,21 @@ class QuantumTape(AnnotatedQueue):
             # unable to determine the output dimension
             pass
 
+        if record:
+            if not self._caching:
+                # the tape is only hashed for the record if the hash
+                # was not already computed for the execution cache
+                circuit_hash = self.hash
+
+            # results of tapes that cannot be hashed cannot be validated for reuse
+            self._last_execution = (
+                None if circuit_hash is None else (device, list(params), circuit_hash, res)
+            )
+
         # restore original parameters
         self.set_parameters(saved_parameters)
 
-        if self._caching and circuit_hash not in self._cache_execute:
+        if caching and circuit_hash not in self._cache_execute:
             self._cache_execute[circuit_hash] = res
             if len(self._cache_execute) > self._caching:
                 self._cache_execute.popitem(last=False)
@@ -989,6 +1405,154 @@ class QuantumTape(AnnotatedQueue):
     # call to tape.execute and the internal call to tape.execute_device.
     _execute = execute_device
 
+    def _uses_unshifted_result(self):
+        """Whether Jacobian computations with the options in ``jacobian_options``
+        make use of the result of the tape at the unshifted parameters, which is
+        only the case for first order finite differences.
+
+        Returns:
+            bool: ``True`` if the result of executing the tape should be recorded
+            for reuse by :meth:`~.jacobian`
+        """
+        method = self.jacobian_options.get("method", "best")
+
+        if method not in ("best", "numeric") or self.jacobian_options.get("order", 1) != 1:
+            return False
+
+        if method == "numeric" or self._gradient_info_outdated():
+            return True
+
+        return bool(np.any(self._par_grad_method[self._trainable_idx] == GradMethod.F))
+
+    def _previous_result(self, params, device):
+        """Returns the result of the last execution via :meth:`~.execute`, if it was
+        performed on the same analytic device and with the same tape parameters.
+
+        The tape is only hashed if the device and trainable parameters match, to
+        ensure that the circuit has not otherwise been modified since.
+
+        Args:
+            params (list[Any]): the quantum tape operation parameters
+            device (~.Device): a PennyLane device
+
+        Returns:
+            array[float] or None: the result of the last execution, or ``None``
+            if it cannot be reused
+        """
+        if self._last_execution is None:
+            return None
+
+        last_device, last_params, last_hash, res = self._last_execution
+
+        if last_device is not device or not getattr(device, "analytic", False):
+            return None
+
+        if len(params) != len(last_params) or not all(
+            np.array_equal(p, q) for p, q in zip(params, last_params)
+        ):
+            return None
+
+        saved_parameters = self.get_parameters()
+        self.set_parameters(params)
+        circuit_hash = self.hash
+        self.set_parameters(saved_parameters)
+
+        if circuit_hash is None:
+            # tapes that cannot be hashed cannot be compared
+            return None
+
+        return res if circuit_hash == last_hash else None
+
+    def batch_execute_device(self, params, device, parallel=None):
+        """Execute the tape on a quantum device for several sets of parameters.
+
+        This is a low-level method, intended to be used when computing gradients,
+        and does not support autodifferentiation. All parameter sets are submitted
+        together, allowing the executions to be batched.
+
+        Args:
+            params (array[float]): 2-dimensional array, where each row is a set of
+                quantum tape operation parameters
+            device (~.Device): a PennyLane device
+                that can execute quantum operations and return measurement statistics
+            parallel (None or str): If ``"thread"``, the parameter sets are executed
+                concurrently using a thread pool. Each worker thread executes a copy
+                of the tape and its operations, using a shallow copy of the device.
+                If ``None``, the parameter sets are executed sequentially.
+
+        Returns:
+            list[array[float]]: the results of executing the tape for each parameter set
+
+        Raises:
+            ValueError: if the parallel execution mode is unknown, or if the device
+                does not support concurrent execution of shallow copies
+
+        .. note::
+
+            Shallow copies of a device share all attributes that are not replaced
+            during execution, such as backend or connection objects. Parallel execution
+            is therefore only available for devices that declare the
+            ``supports_parallel_copies`` capability, which indicates that the device
+            only stores its state by rebinding attributes.
+        """
+        if parallel is None:
+            return [np.asarray(self.execute_device(p, device)) for p in params]
+
+        if parallel != "thread":
+            raise ValueError(
+                f"Unknown parallel execution mode '{parallel}'. Must be one of None or 'thread'."
+            )
+
+        if not device.capabilities().get("supports_parallel_copies", False):
+            raise ValueError(f"The {device.short_name} device does not support parallel execution.")
+
+        if self._parallel_execution is None or self._parallel_execution[0] is not device:
+            with self._parallel_pool(device):
+                return self.batch_execute_device(params, device, parallel=parallel)
+
+        _, executor, worker = self._parallel_execution
+
+        # The tape operations and the device both store state during execution,
+        # and so cannot be shared between concurrent executions. Rather than copying
+        # them for every parameter set, each worker thread creates its own copies
+        # once, and reuses them for all subsequent executions within the pool context.
+        # The tape copy is only replaced if the measurements have since been modified,
+        # as is the case for the parameter-shift rule of variances.
+        measurements = tuple(self._measurements)
+
+        def _execute(p):
+            if not hasattr(worker, "device"):
+                worker.device = copy.copy(device)
+
+            if getattr(worker, "measurements", None) != measurements:
+                worker.tape = self.copy(copy_operations=True)
+                worker.measurements = measurements
+
+            return np.asarray(worker.tape.execute_device(p, worker.device))
+
+        return list(executor.map(_execute, params))
+
+    @contextlib.contextmanager
+    def _parallel_pool(self, device):
+        """Context manager providing the thread pool and the per-thread worker copies used
+        by :meth:`~.batch_execute_device` to execute the tape in parallel on a device.
+
+        All parallel executions on the same device within the context share the thread
+        pool and worker copies, which are discarded on exit.
+
+        Args:
+            device (~.Device): the device the tape is executed on
+        """
+        previous = self._parallel_execution
+
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            self._parallel_execution = (device, executor, threading.local())
+
+            try:
+                yield
+            finally:
+                self._parallel_execution = previous
+
     # ========================================================
     # gradient methods
     # ========================================================
@@ -1027,39 +1591,55 @@ class QuantumTape(AnnotatedQueue):
         Returns:
             str: partial derivative method to be used
         """
-        op = self._par_info[idx]["op"]
+        op = self._par_ops[idx]
 
         if op.grad_method is None:
             return None
 
         if (self._graph is not None) or use_graph:
-            # an empty list to store the 'best' partial derivative method
-            # for each observable
-            best = []
+            # An operation acting on a wire of an observable is always one of its
+            # ancestors, so the circuit graph is only built if this is not the case.
+            if any(w in ob.wires for ob in self.observables for w in op.wires):
+                return default_method
 
-            # loop over all observables
-            for ob in self.observables:
-                # check if op is an ancestor of ob
-                has_path = self.graph.has_path(op, ob)
+            graph = self.graph
 
-                # Use finite differences if there is a path, else the gradient is zero
-                best.append(default_method if has_path else "0")
-
-            if all(k == "0" for k in best):
+            # The gradient is zero if op is not an ancestor of any observable;
+            # stop searching as soon as a path to an observable is found.
+            if not any(graph.has_path(op, ob) for ob in self.observables):
                 return "0"
 
         return default_method
 
+    def _gradient_info_outdated(self):
+        """Whether gradient information is missing for any of the trainable parameters.
+
+        Returns:
+            bool: ``True`` if :meth:`~._update_gradient_info` needs to be called
+        """
+        if self._par_grad_method is None:
+            return True
+
+        return bool(np.any(self._trainable_mask & ~self._par_grad_method_mask))
+
     def _update_gradient_info(self):
-        """Update the parameter information dictionary with gradient information
-        of each parameter"""
+        """Update the parameter information arrays with gradient information
+        of each trainable parameter.
 
-        for i, info in self._par_info.items():
+        The gradient method of a parameter only depends on the circuit structure, and
+        is reset whenever the structure is updated. Gradient methods that have already
+        been computed are therefore reused, and are only computed for trainable
+        parameters that have not previously been trainable."""
+        if self._par_grad_method is None:
+            self._par_grad_method = np.zeros(len(self._par_ops), dtype=np.uint8)
+            self._par_grad_method_mask = np.zeros(len(self._par_ops), dtype=bool)
 
-            if i not in self.trainable_params:
-                info["grad_method"] = None
-            else:
-                info["grad_method"] = self._grad_method(i, use_graph=True)
+        missing = self._trainable_mask & ~self._par_grad_method_mask
+
+        for i in np.flatnonzero(missing).tolist():
+            self._par_grad_method[i] = _GRAD_METHOD_CODES[self._grad_method(i, use_graph=True)]
+
+        self._par_grad_method_mask |= missing
 
     def _grad_method_validation(self, method):
         """Validates if the gradient method requested is supported by the trainable
@@ -1074,32 +1654,29 @@ class QuantumTape(AnnotatedQueue):
         * An exception will be raised if the Jacobian method is ``"analytic"`` but there
           exist some trainable parameters on the tape that only support numeric differentiation.
 
-        If all validations pass, this method will return a tuple containing the allowed parameter
-        gradient methods for each trainable parameter.
+        If all validations pass, this method will return an array containing the allowed
+        parameter gradient method codes (see :class:`GradMethod`) for each trainable parameter.
 
         Args:
             method (str): the overall Jacobian differentiation method
 
         Returns:
-            tuple[str, None]: the allowed parameter gradient methods for each trainable parameter
+            array[int]: the allowed parameter gradient method codes for each trainable parameter
         """
 
-        if "grad_method" not in self._par_info[0]:
+        if self._gradient_info_outdated():
             self._update_gradient_info()
 
-        allowed_param_methods = {
-            idx: info["grad_method"]
-            for idx, info in self._par_info.items()
-            if idx in self.trainable_params
-        }
+        trainable_idx = self._trainable_idx
+        allowed_codes = self._par_grad_method[trainable_idx]
 
         # check and raise an error if any parameters are non-differentiable
-        nondiff_params = {idx for idx, g in allowed_param_methods.items() if g is None}
+        nondiff_params = set(trainable_idx[allowed_codes == GradMethod.NONE].tolist())
 
         if nondiff_params:
             raise ValueError(f"Cannot differentiate with respect to parameter(s) {nondiff_params}")
 
-        numeric_params = {idx for idx, g in allowed_param_methods.items() if g == "F"}
+        numeric_params = set(trainable_idx[allowed_codes == GradMethod.F].tolist())
 
         # If explicitly using analytic mode, ensure that all parameters
         # support analytic differentiation.
@@ -1108,7 +1685,7 @@ class QuantumTape(AnnotatedQueue):
                 f"The analytic gradient method cannot be used with the argument(s) {numeric_params}."
             )
 
-        return tuple(allowed_param_methods.values())
+        return allowed_codes
 
     def numeric_pd(self, idx, device, params=None, **options):
         """Evaluate the gradient of the tape with respect to
@@ -1125,6 +1702,12 @@ class QuantumTape(AnnotatedQueue):
             h=1e-7 (float): finite difference method step size
             order=1 (int): The order of the finite difference method to use. ``1`` corresponds
                 to forward finite differences, ``2`` to centered finite differences.
+            y0 (array[float]): the output of the tape at the unshifted parameters, if
+                already computed
+            y (array[float]): the output of the tape with the parameter shifted by ``h``,
+                if already computed (first order only)
+            parallel=None (None or str): If ``"thread"``, the shifted tapes are executed
+                concurrently using a thread pool (second order only)
 
         Returns:
             array[float]: 1-dimensional array of length determined by the tape output
@@ -1142,19 +1725,25 @@ class QuantumTape(AnnotatedQueue):
         if order == 1:
             # Forward finite-difference.
             # Check if the device has already be pre-computed with
-            # unshifted parameter values, to avoid redundant evaluations.
+            # unshifted or shifted parameter values, to avoid redundant evaluations.
             y0 = options.get("y0", None)
+            y = options.get("y", None)
 
             if y0 is None:
                 y0 = np.asarray(self.execute_device(params, device))
 
-            y = np.asarray(self.execute_device(params + shift, device))
+            if y is None:
+                y = np.asarray(self.execute_device(params + shift, device))
+
             return (y - y0) / h
 
         if order == 2:
-            # central finite difference
-            shift_forward = np.array(self.execute_device(params + shift / 2, device))
-            shift_backward = np.array(self.execute_device(params - shift / 2, device))
+            # Central finite difference.
+            # The forward and backward shifted parameters are submitted as a single batch.
+            shifted = [params + shift / 2, params - shift / 2]
+            shift_forward, shift_backward = self.batch_execute_device(
+                shifted, device, parallel=options.get("parallel")
+            )
             return (shift_forward - shift_backward) / h
 
         raise ValueError("Order must be 1 or 2.")
@@ -1250,6 +1839,10 @@ class QuantumTape(AnnotatedQueue):
             h=1e-7 (float): finite difference method step size
             order=1 (int): The order of the finite difference method to use. ``1`` corresponds
                 to forward finite differences, ``2`` to centered finite differences.
+            parallel=None (None or str): If ``"thread"``, the finite-difference
+                shifted tapes are executed concurrently using a thread pool. Only supported
+                by devices with the ``supports_parallel_copies`` capability; see
+                :meth:`~.batch_execute_device`.
 
         Returns:
             array[float]: 2-dimensional array of shape ``(tape.num_params, tape.output_dim)``
@@ -1316,6 +1909,12 @@ class QuantumTape(AnnotatedQueue):
         if method not in ("best", "numeric", "analytic", "device"):
             raise ValueError(f"Unknown gradient method '{method}'")
 
+        if options.get("parallel") == "thread" and self._parallel_execution is None:
+            # Share the thread pool and worker copies between all batches of
+            # shifted tapes executed during the Jacobian computation.
+            with self._parallel_pool(device):
+                return QuantumTape.jacobian(self, device, params=params, **options)
+
         if params is None:
             params = self.get_parameters()
 
@@ -1326,43 +1925,65 @@ class QuantumTape(AnnotatedQueue):
             return self.device_pd(device, params=params, **options)
 
         # perform gradient method validation
-        allowed_param_methods = self._grad_method_validation(method)
+        allowed_codes = self._grad_method_validation(method)
+        differentiable = allowed_codes != GradMethod.ZERO
 
-        if not params.size or all(g == "0" for g in allowed_param_methods):
+        if not params.size or not differentiable.any():
             # Either all parameters have grad method 0, or there are no trainable
             # parameters. Simply return an empty Jacobian.
             return np.zeros((self.output_dim, len(params)), dtype=float)
 
-        if method == "numeric" or "F" in allowed_param_methods:
-            # there exist parameters that will be differentiated numerically
+        # the parameters that will be differentiated numerically; all remaining
+        # differentiable parameters are differentiated analytically
+        if method == "numeric":
+            numeric = differentiable
+        else:
+            numeric = allowed_codes == GradMethod.F
 
-            if options.get("order", 1) == 1:
-                # First order (forward) finite-difference will be performed.
-                # Compute the value of the tape at the current parameters here. This ensures
-                # this computation is only performed once, for all parameters.
-                options["y0"] = np.asarray(self.execute_device(params, device))
+        numeric_idx = np.flatnonzero(numeric)
 
-        jac = None
-        p_ind = range(len(params))
+        # finite-difference outputs at the shifted parameters, indexed by parameter
+        numeric_y = {}
 
-        # loop through each parameter and compute the gradient
-        for idx, (l, param_method) in enumerate(zip(p_ind, allowed_param_methods)):
+        if numeric_idx.size and options.get("order", 1) == 1:
+            # First order (forward) finite-difference will be performed.
+            # Submit the tape at the current parameters, followed by the tape with each
+            # numerically differentiated parameter shifted, as a single batch. This ensures
+            # the unshifted computation is only performed once, for all parameters.
+            h = options.get("h", 1e-7)
+            shifted = np.tile(np.asarray(params, dtype=np.float64), (len(numeric_idx) + 1, 1))
+            shifted[np.arange(1, len(numeric_idx) + 1), numeric_idx] += h
 
-            if param_method == "0":
-                # Independent parameter. Skip, as this parameter has a gradient of 0.
-                continue
+            # if the tape was just executed at the current parameters, reuse the result
+            y0 = self._previous_result(params, device)
 
-            if (method == "best" and param_method[0] == "F") or (method == "numeric"):
-                # finite difference method
-                g = self.numeric_pd(l, device, params=params, **options)
+            if y0 is not None:
+                shifted = shifted[1:]
 
-            elif (method == "best" and param_method[0] == "A") or (method == "analytic"):
-                # analytic method
-                g = self.analytic_pd(l, device, params=params, **options)
+            y = self.batch_execute_device(shifted, device, parallel=options.get("parallel"))
 
-            if g.dtype is np.dtype("object"):
-                # object arrays cannot be flattened; must hstack them
-                g = np.hstack(g)
+            if y0 is None:
+                y0, y = y[0], y[1:]
+
+            options["y0"] = np.asarray(y0)
+            numeric_y = dict(zip(numeric_idx.tolist(), y))
+
+        # The shifted outputs are provided per parameter; a user-provided value
+        # cannot apply to every parameter, and is discarded.
+        options.pop("y", None)
+
+        jac = None
+
+        # Loop through each differentiable parameter and compute the gradient.
+        # Independent parameters are skipped, as they have a gradient of 0.
+        for idx in np.flatnonzero(differentiable).tolist():
+
+            if numeric[idx]:
+                # finite difference method
+                g = self.numeric_pd(idx, device, params=params, y=numeric_y.get(idx), **options)
+            else:
+                # analytic method
+                g = self.analytic_pd(idx, device, params=params, **options)
 
             if jac is None:
                 # The Jacobian matrix has not yet been created, as we needed at least
@@ -1370,7 +1991,18 @@ class QuantumTape(AnnotatedQueue):
                 # dimension is known.
                 jac = np.zeros((self.output_dim, len(params)), dtype=float)
 
-            jac[:, idx] = g.flatten()
+            if g.dtype is np.dtype("object"):
+                # object arrays (ragged measurement results) cannot be flattened;
+                # write each measurement result directly into its slice of the column
+                offset = 0
+
+                for r in g:
+                    r = np.ravel(r)
+                    jac[offset : offset + r.size, idx] = r
+                    offset += r.size
+
+            else:
+                jac[:, idx] = g.ravel()
 
         return jac
 
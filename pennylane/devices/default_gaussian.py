@@ -691,6 +691,7 @@ class DefaultGaussian(Device):
         self.hbar = hbar
         self.analytic = analytic
 
+        self._symplectic = None
         self.reset()
 
     @classmethod
@@ -703,9 +704,27 @@ class DefaultGaussian(Device):
             returns_probs=False,
             returns_state=False,
             supports_reversible_diff=False,
+            supports_parallel_copies=True,
         )
         return capabilities
 
+    @property
+    def _state(self):
+        """list[array]: the vector of means and the covariance matrix of the device state"""
+        if self._symplectic is not None:
+            # apply the accumulated symplectic matrix to the means vector and covariance matrix
+            S = self._symplectic
+            self._symplectic = None
+            means, cov = self._gaussian_state
+            self._gaussian_state = [S @ means, np.linalg.multi_dot([S, cov, S.T])]
+
+        return self._gaussian_state
+
+    @_state.setter
+    def _state(self, state):
+        self._symplectic = None
+        self._gaussian_state = state
+
     def pre_apply(self):
         self.reset()
 
@@ -742,12 +761,14 @@ class DefaultGaussian(Device):
         # expand the symplectic to act on the proper subsystem
         S = self.expand(S, device_wires)
 
-        # apply symplectic matrix to the means vector
-        means = S @ self._state[0]
-        # apply symplectic matrix to the covariance matrix
-        cov = S @ self._state[1] @ S.T
-
-        self._state = [means, cov]
+        # Consecutive symplectic matrices are multiplied together, and the product is
+        # only applied to the state when it is next accessed. This requires a single
+        # matrix product per gate, rather than transforming both the means vector
+        # and the covariance matrix.
+        if self._symplectic is None:
+            self._symplectic = S
+        else:
+            self._symplectic = S @ self._symplectic
 
     def expand(self, S, wires):
         r"""Expands a Symplectic matrix S to act on the entire subsystem.
@@ -142,7 +142,6 @@ class DefaultQubit(QubitDevice):
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
 
-        # apply the circuit operations
         for i, operation in enumerate(operations):
 
             if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
@@ -151,14 +150,77 @@ class DefaultQubit(QubitDevice):
                     "on a {} device.".format(operation.name, self.short_name)
                 )
 
-            self._apply_operation(operation)
+        # apply the circuit operations
+        self._apply_operations(operations)
 
         # store the pre-rotated state
         self._pre_rotated_state = self._state
 
         # apply the circuit rotations
-        for operation in rotations:
-            self._apply_operation(operation)
+        self._apply_operations(rotations)
+
+    def _apply_operations(self, operations):
+        """Applies a sequence of operations to the internal device state.
+
+        Pairs of consecutive single-qubit operations acting on different wires,
+        that are applied using their matrix representation, are applied together
+        in a single pass over the state.
+
+        Args:
+            operations (list[~.Operation]): operations to apply on the device
+        """
+        pending = None
+
+        for operation in operations:
+            fusable = (
+                len(operation.wires) == 1
+                and operation.name not in self._apply_ops
+                and not isinstance(operation, (QubitStateVector, BasisState, DiagonalOperation))
+            )
+
+            if fusable and pending is not None and pending.wires != operation.wires:
+                self._apply_unitary_pair(pending, operation)
+                pending = None
+                continue
+
+            if pending is not None:
+                self._apply_operation(pending)
+                pending = None
+
+            if fusable:
+                pending = operation
+            else:
+                self._apply_operation(operation)
+
+        if pending is not None:
+            self._apply_operation(pending)
+
+    def _apply_unitary_pair(self, op1, op2):
+        """Applies two single-qubit operations, acting on different wires,
+        to the internal device state using a single einsum.
+
+        Args:
+            op1 (~.Operation): first single-qubit operation to apply
+            op2 (~.Operation): second single-qubit operation to apply
+        """
+        mat1 = self._cast(self._get_unitary_matrix(op1), dtype=self.C_DTYPE)
+        mat2 = self._cast(self._get_unitary_matrix(op2), dtype=self.C_DTYPE)
+
+        # translate to wire labels used by device
+        wire1 = self.map_wires(op1.wires).labels[0]
+        wire2 = self.map_wires(op2.wires).labels[0]
+
+        # Tensor indices of the quantum state
+        state_indices = ABC[: self.num_wires]
+
+        # The indices of the state affected by each operation are
+        # replaced by two new indices, which are summed over
+        a1, a2 = ABC[wire1], ABC[wire2]
+        n1, n2 = ABC[self.num_wires : self.num_wires + 2]
+        new_state_indices = state_indices.replace(a1, n1).replace(a2, n2)
+
+        einsum_indices = f"{n1}{a1},{n2}{a2},{state_indices}->{new_state_indices}"
+        self._state = self._einsum(einsum_indices, mat1, mat2, self._state)
 
     def _apply_operation(self, operation):
         """Applies operations to the internal device state.
@@ -368,6 +430,7 @@ class DefaultQubit(QubitDevice):
             supports_reversible_diff=True,
             supports_inverse_operations=True,
             supports_analytic_computation=True,
+            supports_parallel_copies=True,
             returns_state=True,
         )
         return capabilities
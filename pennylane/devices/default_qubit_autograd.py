@@ -118,6 +118,7 @@ class DefaultQubitAutograd(DefaultQubit):
         capabilities.update(
             passthru_interface="autograd",
             supports_reversible_diff=False,
+            supports_parallel_copies=True,
         )
         return capabilities
 
@@ -165,6 +165,7 @@ class DefaultQubitTF(DefaultQubit):
         capabilities.update(
             passthru_interface="tf",
             supports_reversible_diff=False,
+            supports_parallel_copies=False,
         )
         return capabilities
 
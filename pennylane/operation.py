@@ -100,6 +100,7 @@ and :math:`\mathbf{r} = (\I, \x_0, \p_0, \x_1, \p_1, \ldots)` for multi-mode ope
     the finite-difference method of gradient computation.
 """
 import abc
+import copy
 import itertools
 import functools
 import numbers
@@ -368,7 +369,9 @@ class Operator(abc.ABC):
         if wires is None:
             raise ValueError("Must specify the wires that {} acts on".format(self.name))
 
-        self._wires = Wires(wires)  #: Wires: wires on which the operator acts
+        # Wires objects are immutable, and can be shared between operators
+        #: Wires: wires on which the operator acts
+        self._wires = wires if isinstance(wires, Wires) else Wires(wires)
 
         # check that the number of wires given corresponds to required number
         if (
@@ -396,6 +399,15 @@ class Operator(abc.ABC):
         if do_queue:
             self.queue()
 
+    def __copy__(self):
+        cls = self.__class__
+        copied_op = cls.__new__(cls)
+        copied_op.__dict__.update(self.__dict__)
+        # the parameter list is not shared, so that the parameters of the copy
+        # can be modified independently of the original operator
+        copied_op.data = self.data.copy()
+        return copied_op
+
     def __str__(self):
         """Operator name and some information."""
         return "{}: {} params, wires {}".format(self.name, len(self.data), self.wires.tolist())
@@ -658,6 +670,13 @@ class Operation(Operator):
         quantum operations."""
         raise NotImplementedError
 
+    @classproperty
+    def has_decomposition(self):
+        """Returns True iff the Operation has overridden the :meth:`~.Operation.decomposition`
+        static method, thereby indicating that it can be decomposed into other operations.
+        """
+        return Operation.decomposition != self.decomposition
+
     def inv(self):
         """Inverts the operation, such that the inverse will
         be used for the computations by the specific device.
@@ -1158,6 +1177,14 @@ class Tensor(Observable):
         """Constructor-call-like representation."""
         return "Tensor(" + ", ".join([repr(o) for o in self.obs]) + ")"
 
+    def __copy__(self):
+        cls = self.__class__
+        copied_op = cls.__new__(cls)
+        copied_op.__dict__.update(self.__dict__)
+        # the tensor parameters are those of its constituent observables
+        copied_op.obs = [copy.copy(o) for o in self.obs]
+        return copied_op
+
     @property
     def name(self):
         """All constituent observable names making up the tensor product.
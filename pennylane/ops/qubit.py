@@ -26,10 +26,46 @@ from pennylane.operation import AnyWires, Observable, Operation, DiagonalOperati
 from pennylane.templates.state_preparations import BasisStatePreparation, MottonenStatePreparation
 from pennylane.utils import pauli_eigs, expand
 from pennylane._queuing import OperationRecorder
+from pennylane.wires import Wires
 
 INV_SQRT2 = 1 / math.sqrt(2)
 
 
+@functools.lru_cache(maxsize=4096)
+def _interned_wires(wires):
+    """Returns a shared :class:`~.Wires` instance for a hashable wire specification."""
+    return Wires(wires)
+
+
+def _pauli_args(params, wires):
+    """Extracts the parameters and wires passed to a Pauli observable, reusing a previously
+    constructed :class:`~.Wires` instance if the wire is specified by a single integer or
+    string label (or a list/tuple containing one).
+
+    Pauli observables are constructed repeatedly on the same wires, and wire processing
+    dominates their construction cost. Since :class:`~.Wires` objects are immutable,
+    they can safely be shared between operators; the operators themselves are not shared,
+    as they carry mutable state such as their return type and inversion flag.
+
+    Args:
+        params (tuple): positional arguments passed to the observable
+        wires (Any): the ``wires`` keyword argument passed to the observable
+
+    Returns:
+        tuple[tuple, Any]: the observable parameters and wires
+    """
+    if wires is None and params:
+        # the wires were passed as the last positional argument
+        wires, params = params[-1], params[:-1]
+
+    label = wires[0] if isinstance(wires, (list, tuple)) and len(wires) == 1 else wires
+
+    if type(label) in (int, str):
+        wires = _interned_wires(label)
+
+    return params, wires
+
+
 class Hadamard(Observable, Operation):
     r"""Hadamard(wires)
     The Hadamard operator
@@ -104,6 +140,10 @@ class PauliX(Observable, Operation):
     eigvals = pauli_eigs(1)
     matrix = np.array([[0, 1], [1, 0]])
 
+    def __init__(self, *params, wires=None, do_queue=True):
+        params, wires = _pauli_args(params, wires)
+        super().__init__(*params, wires=wires, do_queue=do_queue)
+
     @classmethod
     def _matrix(cls, *params):
         return cls.matrix
@@ -156,6 +196,10 @@ class PauliY(Observable, Operation):
     eigvals = pauli_eigs(1)
     matrix = np.array([[0, -1j], [1j, 0]])
 
+    def __init__(self, *params, wires=None, do_queue=True):
+        params, wires = _pauli_args(params, wires)
+        super().__init__(*params, wires=wires, do_queue=do_queue)
+
     @classmethod
     def _matrix(cls, *params):
         return cls.matrix
@@ -210,6 +254,10 @@ class PauliZ(Observable, DiagonalOperation):
     eigvals = pauli_eigs(1)
     matrix = np.array([[1, 0], [0, -1]])
 
+    def __init__(self, *params, wires=None, do_queue=True):
+        params, wires = _pauli_args(params, wires)
+        super().__init__(*params, wires=wires, do_queue=do_queue)
+
     @classmethod
     def _matrix(cls, *params):
         return cls.matrix
@@ -1568,9 +1616,16 @@ class Hermitian(Observable):
         Returns:
             dict[str, array]: dictionary containing the eigenvalues and the eigenvectors of the Hermitian observable
         """
-        Hmat = self.matrix
-        Hkey = tuple(Hmat.flatten().tolist())
+        A = np.asarray(self.parameters[0])
+
+        # Square matrices already present in the cache were validated when they were
+        # added; only validate (via self.matrix) matrices that have not been seen before.
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            A = self.matrix
+
+        Hkey = tuple(A.flatten().tolist())
         if Hkey not in Hermitian._eigs:
+            Hmat = self.matrix
             w, U = np.linalg.eigh(Hmat)
             Hermitian._eigs[Hkey] = {"eigvec": U, "eigval": w}
 
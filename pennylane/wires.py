@@ -382,14 +382,14 @@ class Wires(Sequence):
         <Wires = [4, 0, 1, 3, 5]>
         """
 
-        combined = []
         for wires in list_of_wires:
             if not isinstance(wires, Wires):
                 raise WireError(
                     "Expected a Wires object; got {} of type {}".format(wires, type(wires))
                 )
 
-            combined.extend(wire for wire in wires.labels if wire not in combined)
+        # a dictionary is used as an insertion-ordered set of the wire labels
+        combined = list(dict.fromkeys(w for wires in list_of_wires for w in wires.labels))
 
         if sort:
             if all([isinstance(w, int) for w in combined]):
@@ -199,6 +199,14 @@ class TestProperties:
         m = MeasurementProcess(Expectation, obs=obs)
         assert m.eigvals is None
 
+    def test_slots(self):
+        """Test that measurement processes do not have an instance dictionary"""
+        m = MeasurementProcess(Expectation, obs=qml.PauliZ(wires=0))
+        assert not hasattr(m, "__dict__")
+
+        with pytest.raises(AttributeError):
+            m.unknown_attribute = None
+
 
 class TestExpansion:
     """Test for measurement expansion"""
@@ -15,6 +15,7 @@
 Unit tests for the :mod:`pennylane` :class:`QueuingContext` class.
 """
 import contextlib
+import threading
 
 import pytest
 import pennylane as qml
@@ -107,6 +108,29 @@ class TestQueuingContext:
 
         assert not QueuingContext._active_contexts
 
+    def test_thread_local_contexts(self, three_mock_queuing_contexts):
+        """Test that active QueuingContexts are local to the thread they were entered in."""
+        context, thread_context, _ = three_mock_queuing_contexts
+        recording = []
+
+        def record():
+            recording.append(QueuingContext.recording())
+            QueuingContext.append("ignored")
+
+            with thread_context:
+                QueuingContext.append("thread object")
+
+        with context:
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+
+            QueuingContext.append("object")
+
+        assert recording == [False]
+        assert context.queue == ["object"]
+        assert thread_context.queue == ["thread object"]
+
     def test_append_no_context(self):
         """Test that append does not fail when no context is present."""
 
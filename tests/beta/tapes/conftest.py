@@ -0,0 +1,84 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Pytest configuration file for the beta tapes test suite.
+"""
+import functools
+
+import pytest
+
+import pennylane as qml
+
+
+# The following devices are shared between all tests of a module.
+# Since QuantumTape.execute_device resets the device prior to applying
+# the tape operations, no state is carried between tests.
+
+
+@pytest.fixture(scope="module")
+def qubit1_dev():
+    """A single-wire ``default.qubit`` device."""
+    return qml.device("default.qubit", wires=1)
+
+
+@pytest.fixture(scope="module")
+def qubit2_dev():
+    """A two-wire ``default.qubit`` device."""
+    return qml.device("default.qubit", wires=2)
+
+
+@pytest.fixture(scope="module")
+def qubit3_dev():
+    """A three-wire ``default.qubit`` device."""
+    return qml.device("default.qubit", wires=3)
+
+
+@pytest.fixture(scope="module")
+def gaussian2_dev():
+    """A two-mode ``default.gaussian`` device."""
+    return qml.device("default.gaussian", wires=2)
+
+
+class CallCounter:
+    """Counts the number of calls made to a method of a class.
+
+    Unlike ``mocker.spy``, the arguments of each call are not recorded.
+
+    Args:
+        monkeypatch (MonkeyPatch): the pytest monkeypatch fixture, used to
+            restore the original method once the test completes
+        cls (type): the class the method belongs to
+        name (str): the name of the method
+    """
+
+    def __init__(self, monkeypatch, cls, name):
+        self.call_count = 0
+        method = getattr(cls, name)
+
+        def counted(*args, **kwargs):
+            self.call_count += 1
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(cls, name, counted)
+
+    def reset(self):
+        """Resets the call count to zero."""
+        self.call_count = 0
+
+
+@pytest.fixture
+def count_calls(monkeypatch):
+    """Returns a function ``count_calls(cls, name)`` that counts the calls made to the
+    method ``name`` of class ``cls`` for the duration of the test."""
+    return functools.partial(CallCounter, monkeypatch)
@@ -82,6 +82,19 @@ class TestTapeCaching:
         spy.assert_not_called()
         assert len(tape._cache_execute) == 1
 
+    def test_unhashable_not_cached(self, mocker):
+        """Test that tapes that cannot be hashed are executed without caching"""
+        dev = qml.device("default.qubit", wires=2)
+        tape = get_tape(10)
+
+        mocker.patch.object(QuantumTape, "hash", new_callable=mocker.PropertyMock, return_value=None)
+        spy = mocker.spy(DefaultQubit, "execute")
+        tape.execute(device=dev)
+        tape.execute(device=dev)
+
+        assert len(spy.call_args_list) == 2
+        assert len(tape._cache_execute) == 0
+
     def test_add_to_cache_execute(self):
         """Test that the _cache_execute attribute is added to when the tape is executed"""
         dev = qml.device("default.qubit", wires=2)
@@ -89,7 +102,7 @@ class TestTapeCaching:
 
         result = tape.execute(device=dev)
         cache_execute = tape._cache_execute
-        hashed = tape.graph.hash
+        hashed = tape.hash
 
         assert len(cache_execute) == 1
         assert hashed in cache_execute
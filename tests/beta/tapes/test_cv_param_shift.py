@@ -543,6 +543,25 @@ class TestExpectationQuantumGradients:
 
         assert np.allclose(grad_A2, expected, atol=tol, rtol=0)
 
+    def test_batched_first_order_shifts(self, mocker, tol):
+        """Test that the shifted parameters of all parameters differentiated using
+        the first-order rule are submitted for execution as a single batch."""
+        dev = qml.device("default.gaussian", wires=1, hbar=hbar)
+
+        with CVParamShiftTape() as tape:
+            qml.Displacement(0.5, 0.1, wires=[0])
+            qml.Rotation(-0.3, wires=[0])
+            expval(qml.X(0))
+
+        spy = mocker.spy(CVParamShiftTape, "batch_execute_device")
+        grad_A = tape.jacobian(dev, method="analytic")
+
+        assert spy.call_count == 1
+        assert len(spy.call_args[0][1]) == 2 * tape.num_params
+
+        grad_F = tape.jacobian(dev, method="numeric")
+        assert np.allclose(grad_A, grad_F, atol=tol, rtol=0)
+
     cv_ops = [getattr(qml, name) for name in qml.ops._cv__ops__]
     analytic_cv_ops = [cls for cls in cv_ops if cls.supports_parameter_shift]
 
@@ -254,6 +254,29 @@ class TestTapeConstruction:
 
         assert jac.shape == (4, 2)
 
+    def test_expansion(self, mocker):
+        """Test that unsupported operations are expanded on every construction,
+        while the supported operations are only determined once"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def func(x):
+            qml.RX(x, wires=0)
+            qml.CRX(x, wires=[0, 1])
+            return expval(qml.PauliZ(1))
+
+        qn = QNode(func, dev, diff_method="parameter-shift")
+        spy = mocker.spy(QubitParamShiftTape, "expand")
+
+        qn(0.1)
+        stop_at = qn._stop_at
+        assert "RX" in stop_at
+        assert "CRX" not in stop_at
+        assert "CRX" not in [op.name for op in qn.qtape.operations]
+
+        qn(0.2)
+        assert qn._stop_at is stop_at
+        assert spy.call_count == 2
+
     def test_returning_non_measurements(self):
         """Test that an exception is raised if a non-measurement
         is returned from the QNode."""
@@ -117,6 +117,106 @@ class TestParameterShiftRule:
         numeric_val = tape.jacobian(dev, shift=shift, method="numeric")
         assert np.allclose(autograd_val, numeric_val, atol=tol, rtol=0)
 
+    def test_batched_shifts(self, mocker, tol):
+        """Tests that the forward and backward shifted parameters of all
+        parameters are submitted for execution as a single batch."""
+        spy = mocker.spy(QubitParamShiftTape, "batch_execute_device")
+        dev = qml.device("default.qubit", wires=1)
+        x, y = 0.543, -0.654
+
+        with QubitParamShiftTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[0])
+            expval(qml.PauliZ(0))
+
+        res = tape.jacobian(dev, method="analytic")
+        assert spy.call_count == 1
+
+        shifted = spy.call_args_list[0][0][1]
+        expected_shifted = [
+            [x + np.pi / 2, y],
+            [x - np.pi / 2, y],
+            [x, y + np.pi / 2],
+            [x, y - np.pi / 2],
+        ]
+        assert np.allclose(shifted, expected_shifted, atol=tol, rtol=0)
+
+        expected = [[-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        res = tape.jacobian(dev, method="analytic", parallel="thread")
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_parallel_variance(self, tol):
+        """Tests that the gradient of a variance is correct if the shifted tapes
+        are executed in parallel, as the measurements are modified between batches"""
+        dev = qml.device("default.qubit", wires=2)
+        x, y = 0.543, -0.654
+
+        with QubitParamShiftTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            var(qml.Hermitian(np.diag([1.0, 2.0]), wires=1))
+            expval(qml.PauliZ(0))
+
+        tape.trainable_params = {0, 1}
+        expected = tape.jacobian(dev, method="analytic")
+        res = tape.jacobian(dev, method="analytic", parallel="thread")
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_batched_variance_shifts(self, mocker, tol):
+        """Tests that the shifted parameters of all parameters are submitted as a
+        single batch for each set of measurements required by the variance rule."""
+        dev = qml.device("default.qubit", wires=2)
+
+        with QubitParamShiftTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            var(qml.Hermitian(np.diag([1.0, 2.0]), wires=1))
+            var(qml.PauliZ(0))
+
+        tape.trainable_params = {0, 1}
+        spy = mocker.spy(QubitParamShiftTape, "batch_execute_device")
+        res = tape.jacobian(dev, method="analytic")
+
+        # one batch for the expectation values <A>, and one
+        # for the squared non-involutory observables <A^2>
+        assert spy.call_count == 2
+        assert all(len(call[0][1]) == 4 for call in spy.call_args_list)
+
+        expected = tape.jacobian(dev, method="numeric")
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        # the modified measurements are not kept after the Jacobian computation
+        assert tape._var_measurements is None
+
+    def test_variance_partial_derivative(self, tol):
+        """Tests that the partial derivative of a variance can be computed
+        outside of a Jacobian computation."""
+        dev = qml.device("default.qubit", wires=1)
+        A = np.diag([1.0, 2.0])
+
+        with QubitParamShiftTape() as tape:
+            qml.RX(0.543, wires=[0])
+            var(qml.Hermitian(A, wires=0))
+
+        tape.trainable_params = {0}
+        tape._evA = None
+        res = tape.parameter_shift_var(0, dev, tape.get_parameters())
+
+        expected = tape.jacobian(dev, method="numeric")
+        assert np.allclose(res, expected[:, 0], atol=tol, rtol=0)
+
+        # the partial derivative reflects changes to the observable
+        tape._evA = None
+        A[1, 1] = 3.0
+        res = tape.parameter_shift_var(0, dev, tape.get_parameters())
+
+        expected = tape.jacobian(dev, method="numeric")
+        assert np.allclose(res, expected[:, 0], atol=tol, rtol=0)
+
     @pytest.mark.parametrize("theta", np.linspace(-2 * np.pi, 2 * np.pi, 7))
     @pytest.mark.parametrize("shift", [np.pi / 2, 0.3, np.sqrt(2)])
     def test_Rot_gradient(self, mocker, theta, shift, tol):
@@ -248,10 +348,10 @@ class TestParameterShiftRule:
 class TestJacobianIntegration:
     """Tests for general Jacobian integration"""
 
-    def test_single_expectation_value(self, tol):
+    def test_single_expectation_value(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with a single expval output"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -267,10 +367,10 @@ class TestJacobianIntegration:
         expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_multiple_expectation_values(self, tol):
+    def test_multiple_expectation_values(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with multiple expval outputs"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -287,10 +387,10 @@ class TestJacobianIntegration:
         expected = np.array([[-np.sin(x), 0], [0, np.cos(y)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_var_expectation_values(self, tol):
+    def test_var_expectation_values(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with expval and var outputs"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -307,10 +407,10 @@ class TestJacobianIntegration:
         expected = np.array([[-np.sin(x), 0], [0, -2 * np.cos(y) * np.sin(y)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_prob_expectation_values(self, tol):
+    def test_prob_expectation_values(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with prob and expval outputs"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -351,13 +451,13 @@ class TestJacobianIntegration:
 
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_involutory_variance(self, mocker, tol):
+    def test_involutory_variance(self, qubit1_dev, mocker, tol):
         """Tests qubit observable that are involutory"""
         spy_analytic_var = mocker.spy(QubitParamShiftTape, "parameter_shift_var")
         spy_numeric = mocker.spy(QubitParamShiftTape, "numeric_pd")
         spy_execute = mocker.spy(QubitParamShiftTape, "execute_device")
 
-        dev = qml.device("default.qubit", wires=1)
+        dev = qubit1_dev
         a = 0.54
 
         with QubitParamShiftTape() as tape:
@@ -380,20 +480,22 @@ class TestJacobianIntegration:
 
         gradF = tape.jacobian(dev, method="numeric")
         spy_numeric.assert_called()
-        assert len(spy_execute.call_args_list) == 2
+
+        # the result of the unshifted tape execution above is reused
+        assert len(spy_execute.call_args_list) == 1
 
         expected = 2 * np.sin(a) * np.cos(a)
 
         assert gradF == pytest.approx(expected, abs=tol)
         assert gradA == pytest.approx(expected, abs=tol)
 
-    def test_non_involutory_variance(self, mocker, tol):
+    def test_non_involutory_variance(self, qubit1_dev, mocker, tol):
         """Tests a qubit Hermitian observable that is not involutory"""
         spy_analytic_var = mocker.spy(QubitParamShiftTape, "parameter_shift_var")
         spy_numeric = mocker.spy(QubitParamShiftTape, "numeric_pd")
         spy_execute = mocker.spy(QubitParamShiftTape, "execute_device")
 
-        dev = qml.device("default.qubit", wires=1)
+        dev = qubit1_dev
         A = np.array([[4, -1 + 6j], [-1 - 6j, 2]])
         a = 0.54
 
@@ -419,20 +521,22 @@ class TestJacobianIntegration:
 
         gradF = tape.jacobian(dev, method="numeric")
         spy_numeric.assert_called()
-        assert len(spy_execute.call_args_list) == 2
+
+        # the result of the unshifted tape execution above is reused
+        assert len(spy_execute.call_args_list) == 1
 
         expected = -35 * np.sin(2 * a) - 12 * np.cos(2 * a)
         assert gradA == pytest.approx(expected, abs=tol)
         assert gradF == pytest.approx(expected, abs=tol)
 
-    def test_involutory_and_noninvolutory_variance(self, mocker, tol):
+    def test_involutory_and_noninvolutory_variance(self, qubit2_dev, mocker, tol):
         """Tests a qubit Hermitian observable that is not involutory alongside
         a involutory observable."""
         spy_analytic_var = mocker.spy(QubitParamShiftTape, "parameter_shift_var")
         spy_numeric = mocker.spy(QubitParamShiftTape, "numeric_pd")
         spy_execute = mocker.spy(QubitParamShiftTape, "execute_device")
 
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         A = np.array([[4, -1 + 6j], [-1 - 6j, 2]])
         a = 0.54
 
@@ -460,16 +564,18 @@ class TestJacobianIntegration:
 
         gradF = tape.jacobian(dev, method="numeric")
         spy_numeric.assert_called()
-        assert len(spy_execute.call_args_list) == 1 + 2
+
+        # the result of the unshifted tape execution above is reused
+        assert len(spy_execute.call_args_list) == 2
 
         expected = [2 * np.sin(a) * np.cos(a), -35 * np.sin(2 * a) - 12 * np.cos(2 * a)]
         assert np.diag(gradA) == pytest.approx(expected, abs=tol)
         assert np.diag(gradF) == pytest.approx(expected, abs=tol)
 
-    def test_expval_and_variance(self, tol):
+    def test_expval_and_variance(self, qubit3_dev, tol):
         """Test that the qnode works for a combination of expectation
         values and variances"""
-        dev = qml.device("default.qubit", wires=3)
+        dev = qubit3_dev
 
         a = 0.54
         b = -0.423
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for the qubit parameter-shift QubitParamShiftTape"""
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from pennylane import numpy as np
 
 import pennylane as qml
 from pennylane.beta.interfaces.autograd import AutogradInterface
 from pennylane.beta.tapes import QuantumTape, ReversibleTape, QNode, qnode
+from pennylane.beta.tapes import rev
+from pennylane.beta.tapes.circuit_graph import NewCircuitGraph
 from pennylane.beta.queuing import expval, var, sample, probs, MeasurementProcess
 
 
@@ -38,23 +42,23 @@ class TestReversibleTape:
             expval(qml.PauliZ(0))
 
         spy = mocker.spy(dev, "execute")
+        spy_evolve = mocker.spy(ReversibleTape, "_evolve")
+        spy_gen = mocker.spy(ReversibleTape, "_apply_generator")
         tape.jacobian(dev)
 
-        tape0 = spy.call_args_list[0][0][0]
-        tape1 = spy.call_args_list[1][0][0]
-        tape2 = spy.call_args_list[2][0][0]
-
-        assert tape0 is tape
+        # the device is only used to compute the pre-measurement state
+        spy.assert_called_once()
+        assert spy.call_args[0][0] is tape
 
-        assert len(tape1.operations) == 3
-        assert not tape1.measurements
-        assert tape1.operations[0].name == "RY.inv"
-        assert tape1.operations[1].name == "PauliX"
-        assert tape1.operations[2].name == "RY"
+        # The last parameter is differentiated first; no rewinding is required.
+        # The state is then rewound to just after the RX gate. No replaying is required.
+        circuits = [[op.name for op in call[0][1]] for call in spy_evolve.call_args_list]
+        assert circuits == [[], ["RY"]]
+        assert all(call[1]["inverse"] for call in spy_evolve.call_args_list)
 
-        assert len(tape2.operations) == 1
-        assert not tape2.measurements
-        assert tape2.operations[0].name == "PauliY"
+        # generators are applied directly to the state
+        generators = [call[0][1:3] for call in spy_gen.call_args_list]
+        assert generators == [("PauliY", (0,)), ("PauliX", (0,))]
 
     def test_rot_diff_circuit_construction(self, mocker):
         """Test that the diff circuit is correctly constructed for the Rot gate"""
@@ -66,32 +70,19 @@ class TestReversibleTape:
             expval(qml.PauliZ(0))
 
         spy = mocker.spy(dev, "execute")
+        spy_evolve = mocker.spy(ReversibleTape, "_evolve")
+        spy_gen = mocker.spy(ReversibleTape, "_apply_generator")
         tape.jacobian(dev)
 
-        tape0 = spy.call_args_list[0][0][0]
-        tape1 = spy.call_args_list[1][0][0]
-        tape2 = spy.call_args_list[2][0][0]
-        tape3 = spy.call_args_list[3][0][0]
-
-        assert tape0 is tape
-
-        assert len(tape1.operations) == 5
-        assert not tape1.measurements
-        assert tape1.operations[0].name == "RZ.inv"
-        assert tape1.operations[1].name == "RY.inv"
-        assert tape1.operations[2].name == "PauliZ"
-        assert tape1.operations[3].name == "RY"
-        assert tape1.operations[4].name == "RZ"
+        spy.assert_called_once()
+        assert spy.call_args[0][0] is tape
 
-        assert len(tape2.operations) == 3
-        assert not tape2.measurements
-        assert tape2.operations[0].name == "RZ.inv"
-        assert tape2.operations[1].name == "PauliY"
-        assert tape2.operations[2].name == "RZ"
+        circuits = [[op.name for op in call[0][1]] for call in spy_evolve.call_args_list]
+        assert circuits == [[], ["RZ"], ["RY"]]
+        assert all(call[1]["inverse"] for call in spy_evolve.call_args_list)
 
-        assert len(tape3.operations) == 1
-        assert not tape3.measurements
-        assert tape3.operations[0].name == "PauliZ"
+        generators = [call[0][1] for call in spy_gen.call_args_list]
+        assert generators == ["PauliZ", "PauliY", "PauliZ"]
 
     @pytest.mark.parametrize("op, name", [(qml.CRX, "CRX"), (qml.CRY, "CRY"), (qml.CRZ, "CRZ")])
     def test_controlled_rotation_gates_exception(self, op, name):
@@ -150,6 +141,148 @@ class TestReversibleTape:
         with pytest.raises(ValueError, match="The PhaseShift gate is not currently supported"):
             tape.jacobian(dev)
 
+    def test_single_precision(self, mocker):
+        """Tests that the gradient can be computed using single-precision
+        statevector arithmetic"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(0.1, 0.2, 0.3, wires=1)
+            expval(qml.PauliZ(0))
+            expval(qml.PauliY(1))
+
+        expected = tape.jacobian(dev, method="analytic")
+
+        spy = mocker.spy(ReversibleTape, "_evolve")
+        res = tape.jacobian(dev, method="analytic", grad_precision="single")
+
+        assert all(r.dtype == np.complex64 for r in spy.spy_return_list)
+        assert res.dtype == np.float64
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+    def test_unreachable_observables(self):
+        """Tests that the partial derivatives of observables that do not depend on
+        a differentiated gate are exactly zero"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            qml.RY(-0.123, wires=1)
+            expval(qml.PauliZ(0))
+            expval(qml.PauliZ(1))
+
+        res = tape.jacobian(dev, method="analytic")
+
+        assert res[0, 1] == 0
+        assert res[1, 0] == 0
+
+        expected = np.diag([-np.sin(0.542), np.sin(0.123)])
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    def test_shared_wire_observables_skip_graph(self, mocker, tol):
+        """Tests that the circuit graph is not constructed if every differentiated
+        gate acts on a wire of each observable"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(-0.123, wires=1)
+            expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        spy = mocker.spy(NewCircuitGraph, "__init__")
+        res = tape.jacobian(dev, method="analytic")
+
+        spy.assert_not_called()
+        assert tape._graph is None
+
+        expected = tape.jacobian(dev, method="numeric")
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("k_params", [1, 2])
+    def test_k_params(self, k_params, mocker):
+        """Tests that only k_params randomly sampled parameters are
+        differentiated if requested"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(0.1, 0.2, 0.3, wires=1)
+            expval(qml.PauliZ(0))
+            expval(qml.PauliY(1))
+
+        expected = tape.jacobian(dev, method="analytic")
+
+        spy = mocker.spy(ReversibleTape, "_apply_generator")
+        res = tape.jacobian(dev, method="analytic", k_params=k_params)
+
+        assert spy.call_count == k_params
+
+        sampled = sorted(tape._pd)
+        unsampled = [i for i in range(4) if i not in sampled]
+        assert len(sampled) == k_params
+
+        assert np.all(res[:, unsampled] == 0)
+        assert np.allclose(res[:, sampled], expected[:, sampled], atol=1e-8, rtol=0)
+
+    def test_k_params_seed(self):
+        """Tests that the sampled parameters are determined by the provided seed,
+        that independent parameters are never sampled, and that the global
+        NumPy random state is left untouched"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            qml.RY(0.1, wires=2)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(0.1, 0.2, 0.3, wires=1)
+            expval(qml.PauliZ(0))
+            expval(qml.PauliY(1))
+
+        np.random.seed(42)
+        global_state = np.random.get_state()[1].copy()
+
+        sampled = []
+        for seed in [1, 1, np.random.default_rng(1)]:
+            tape.jacobian(dev, method="analytic", k_params=2, seed=seed)
+            sampled.append(sorted(tape._pd))
+
+        assert sampled[0] == sampled[1] == sampled[2]
+        assert 1 not in sampled[0]
+
+        # the independent parameter 1 is never sampled, so that all
+        # remaining parameters are differentiated
+        tape.jacobian(dev, method="analytic", k_params=4)
+        assert sorted(tape._pd) == [0, 2, 3, 4]
+
+        assert np.all(np.random.get_state()[1] == global_state)
+
+    @pytest.mark.parametrize("k_params", [0, -1, 1.5, True])
+    def test_invalid_k_params_exception(self, k_params):
+        """Tests that an exception is raised if k_params is not a positive integer"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="k_params must be a positive integer"):
+            tape.jacobian(dev, k_params=k_params)
+
+    def test_unknown_precision_exception(self):
+        """Tests that an exception is raised for an unknown gradient precision"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with ReversibleTape() as tape:
+            qml.RX(0.542, wires=0)
+            expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="Unknown gradient precision half"):
+            tape.jacobian(dev, grad_precision="half")
+
 
 class TestGradients:
     """Jacobian integration tests for qubit expectations."""
@@ -501,3 +634,170 @@ class TestHelperFunctions:
         tape = ReversibleTape()
         res = tape._matrix_elem(vec1, obs, vec2, dev)
         assert res == expected
+
+    def test_matrix_elem_parameter_update(self):
+        """Tests that the cached observable matrix used by _matrix_elem
+        is updated if the observable parameters change"""
+        dev = qml.device("default.qubit", wires=1)
+        vec = np.array([1, 0])
+        obs = qml.Hermitian(np.diag([1, 2]), wires=0)
+
+        assert np.allclose(ReversibleTape._matrix_elem(vec, obs, vec, dev), 1)
+
+        obs.data[0] = np.diag([3, 4])
+        assert np.allclose(ReversibleTape._matrix_elem(vec, obs, vec, dev), 3)
+
+    def test_apply_observables(self):
+        """Tests that the helper function _apply_observables agrees with
+        multiplying the statevector by the observable matrices"""
+        dev = qml.device("default.qubit", wires=2)
+        state = np.array([1, 1j, 0.5, -1]).reshape([2, 2])
+        obs = [
+            qml.PauliZ(1),
+            qml.Hermitian(np.diag([1, 2, 3, 4]), wires=[1, 0]),
+            qml.PauliX(0) @ qml.PauliY(1),
+        ]
+
+        res = ReversibleTape._apply_observables(state, obs, dev)
+
+        mats = [
+            np.kron(np.eye(2), qml.PauliZ.matrix),
+            qml.SWAP.matrix @ np.diag([1, 2, 3, 4]) @ qml.SWAP.matrix,
+            np.kron(qml.PauliX.matrix, qml.PauliY.matrix),
+        ]
+        expected = [(m @ state.flatten()).reshape([2, 2]) for m in mats]
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    def test_apply_observables_parallel(self, monkeypatch, mocker):
+        """Tests that the helper function _apply_observables gives the same
+        result when the observables are applied in parallel"""
+        dev = qml.device("default.qubit", wires=2)
+        state = np.array([1, 1j, 0.5, -1]).reshape([2, 2])
+        obs = [qml.PauliZ(1), qml.PauliX(0) @ qml.PauliY(1), qml.Hadamard(0)]
+
+        expected = ReversibleTape._apply_observables(state, obs, dev)
+
+        monkeypatch.setattr(rev, "_NUM_THREADS", 2)
+        monkeypatch.setattr(rev, "_PARALLEL_MIN_WIRES", 2)
+        monkeypatch.setattr(rev, "_thread_pool", None)
+        spy = mocker.spy(ThreadPoolExecutor, "map")
+
+        res = ReversibleTape._apply_observables(state, obs, dev)
+
+        # the thread pool is created on first use
+        pool = rev._thread_pool
+        assert pool._max_workers == 2
+        spy.assert_called_once()
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+        # subsequent calls reuse the same thread pool
+        ReversibleTape._apply_observables(state, obs, dev)
+        assert rev._thread_pool is pool
+        assert spy.call_count == 2
+        pool.shutdown()
+
+    @pytest.mark.parametrize("apply_ops", [True, False])
+    @pytest.mark.parametrize("gen", [qml.PauliX, qml.PauliY, qml.PauliZ])
+    @pytest.mark.parametrize("wire", [0, 1])
+    def test_apply_generator(self, gen, wire, apply_ops, monkeypatch):
+        """Tests that the helper function _apply_generator applies
+        Pauli generators to the correct subsystem, both using the device's
+        specialized array manipulations and the generator matrices"""
+        dev = qml.device("default.qubit", wires=2)
+        state = np.array([1, 1j, 0.5, -1]).reshape([2, 2])
+
+        if not apply_ops:
+            monkeypatch.setattr(dev, "_apply_ops", {})
+
+        res = ReversibleTape._apply_generator(state, gen.__name__, (wire,), dev)
+
+        mats = [np.eye(2), np.eye(2)]
+        mats[wire] = gen(wire).matrix
+        expected = (np.kron(*mats) @ state.flatten()).reshape([2, 2])
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    def test_evolve(self):
+        """Tests that the helper function _evolve agrees with
+        executing the operations on the device"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.RX(0.543, wires=0)
+            qml.CNOT(wires=[0, 2])
+            qml.Rot(0.1, -0.2, 0.3, wires=1).inv()
+            qml.Toffoli(wires=[2, 1, 0])
+            qml.RY(0.5, wires=2)
+            qml.CZ(wires=[1, 2])
+
+        dev.execute(tape)
+        expected = dev._pre_rotated_state
+
+        initial_state = dev._create_basis_state(0)
+        res = ReversibleTape._evolve(initial_state, tape.operations, dev)
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    def test_evolve_many_operations(self):
+        """Tests that the helper function _evolve supports more operations
+        than there are available einsum indices"""
+        dev = qml.device("default.qubit", wires=2)
+        ops = [qml.RX(0.1, wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.2, wires=1)] * 20
+
+        tape = QuantumTape()
+        tape._ops = ops
+        dev.execute(tape)
+        expected = dev._pre_rotated_state
+
+        state = dev._create_basis_state(0)
+        res = ReversibleTape._evolve(state, ops, dev)
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    @pytest.mark.parametrize(
+        "einsum_str",
+        ["ab,bc,cd->ad", "abc,bcd,a->d", "ab,ab,ab->a", "Zab,cb,da->Zdc", "ab,ba->"],
+    )
+    def test_compiled_contraction(self, einsum_str):
+        """Tests that compiled contractions agree with einsum"""
+        dev = qml.device("default.qubit", wires=1)
+        terms = einsum_str.split("->")[0].split(",")
+        operands = [np.random.random([2] * len(t)) * (1 + 0.5j) for t in terms]
+
+        path = np.einsum_path(einsum_str, *operands, optimize="greedy")[0]
+        steps = rev._compile_contraction(einsum_str, path)
+
+        res = rev._contract(steps, operands, dev)
+        expected = np.einsum(einsum_str, *operands)
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    def test_evolve_inverse(self):
+        """Tests that the helper function _evolve undoes the evolution
+        when inverse=True"""
+        dev = qml.device("default.qubit", wires=3)
+        ops = [
+            qml.Hadamard(wires=0),
+            qml.RX(0.543, wires=0),
+            qml.CNOT(wires=[0, 2]),
+            qml.Rot(0.1, -0.2, 0.3, wires=1),
+            qml.Toffoli(wires=[2, 1, 0]),
+        ]
+
+        state = np.array([1, 1j, 0.5, -1, 0.2, 0, 1, -0.3j]).reshape([2, 2, 2])
+        evolved = ReversibleTape._evolve(state, ops, dev)
+
+        res = ReversibleTape._evolve(evolved, ops, dev, inverse=True)
+        assert np.allclose(res, state, atol=1e-8, rtol=0)
+
+    def test_evolve_batched(self):
+        """Tests that the helper function _evolve evolves each
+        statevector of a batch independently"""
+        dev = qml.device("default.qubit", wires=2)
+        ops = [qml.RX(0.1, wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.2, wires=1)]
+
+        states = [dev._create_basis_state(i) for i in range(4)]
+        res = ReversibleTape._evolve(np.stack(states), ops, dev, batched=True)
+
+        assert res.shape == (4, 2, 2)
+
+        for state, r in zip(states, res):
+            expected = ReversibleTape._evolve(state, ops, dev)
+            assert np.allclose(r, expected, atol=1e-8, rtol=0)
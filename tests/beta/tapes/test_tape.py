@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for the QuantumTape"""
+import concurrent.futures
+import threading
+
 import pytest
 import numpy as np
 
 import pennylane as qml
 from pennylane.beta.tapes import QuantumTape, NewCircuitGraph
-from pennylane.beta.queuing import expval, var, sample, probs, MeasurementProcess
+from pennylane.beta.tapes import tape as tape_module
+from pennylane.beta.tapes.tape import GRAD_METHODS, GradMethod
+from pennylane.beta.queuing import expval, var, sample, probs, state, MeasurementProcess
 
 
 def TestOperationMonkeypatching():
@@ -77,6 +82,21 @@ class TestConstruction:
         assert tape.wires == qml.wires.Wires([0, "a", 4])
         assert tape._output_dim == len(obs[0].wires) + 2 ** len(obs[1].wires)
 
+    def test_output_dim_transforms(self, make_tape):
+        """Test that copied and expanded tapes infer their output dimension"""
+        tape, _, _ = make_tape
+
+        assert tape.copy().output_dim == 5
+        assert tape.expand().output_dim == 5
+
+        with QuantumTape() as tape:
+            qml.RX(0.1, wires=0)
+            state()
+            probs(wires=[0, 1, 2])
+
+        assert tape.output_dim == 8
+        assert tape.expand().output_dim == 8
+
     def test_observable_processing(self, make_tape):
         """Test that observables are processed correctly"""
         tape, ops, obs = make_tape
@@ -177,6 +197,32 @@ class TestConstruction:
             4: {"op": ops[3], "p_idx": 0, "grad_method": "0"},
         }
 
+    def test_parameter_info_arrays(self, make_tape):
+        """Test that parameter information is stored as parallel arrays"""
+        tape, ops, obs = make_tape
+        assert tape._par_ops == [ops[0], ops[1], ops[1], ops[1], ops[3]]
+        assert np.all(tape._par_p_idx == [0, 0, 1, 2, 0])
+        assert tape._par_grad_method is None
+        assert all("grad_method" not in info for info in tape._par_info.values())
+
+        tape._update_gradient_info()
+        assert [GRAD_METHODS[c] for c in tape._par_grad_method] == ["F", "F", "F", "F", "0"]
+        assert tape._par_grad_method.dtype == np.uint8
+
+    def test_grad_method_codes(self):
+        """Test that the gradient method codes map onto the gradient method strings"""
+        assert [m.label for m in GradMethod] == list(GRAD_METHODS)
+        assert GradMethod.ZERO.label == "0"
+        assert GradMethod.A == 3
+
+    def test_trainable_grad_method_counts(self, make_tape):
+        """Test that the number of trainable parameters per gradient method is returned"""
+        tape, _, _ = make_tape
+        assert tape.trainable_grad_method_counts == {None: 0, "0": 1, "F": 4, "A": 0, "A2": 0}
+
+        tape.trainable_params = {0, 4}
+        assert tape.trainable_grad_method_counts == {None: 0, "0": 1, "F": 1, "A": 0, "A2": 0}
+
     def test_qubit_diagonalization(self, make_tape):
         """Test that qubit diagonalization works as expected"""
         tape, ops, obs = make_tape
@@ -188,6 +234,34 @@ class TestConstruction:
             assert isinstance(o1, o2.__class__)
             assert o1.wires == o2.wires
 
+    def test_diagonalizing_gates_cache(self, mocker):
+        """Test that the diagonalizing gates are only reconstructed if the
+        observables or their parameters change"""
+        with QuantumTape() as tape:
+            qml.RX(0.432, wires=0)
+            expval(qml.PauliX(wires=0))
+            expval(qml.Hermitian(np.array([[1, 0], [0, -1]]), wires=1))
+
+        spy = mocker.spy(qml.Hermitian, "diagonalizing_gates")
+
+        gates = tape.diagonalizing_gates
+        assert [g.name for g in gates] == ["Hadamard", "QubitUnitary"]
+        assert spy.call_count == 1
+
+        assert all(g1 is g2 for g1, g2 in zip(tape.diagonalizing_gates, gates))
+        assert spy.call_count == 1
+
+        # changing the observable parameters reconstructs the gates
+        tape.set_parameters([0.432, np.array([[0, 1], [1, 0]])], trainable_only=False)
+        new_gates = tape.diagonalizing_gates
+        assert spy.call_count == 2
+        assert not np.allclose(new_gates[1].data[0], gates[1].data[0])
+
+        # changing the observables reconstructs the gates
+        tape._measurements = tape._measurements[1:]
+        assert [g.name for g in tape.diagonalizing_gates] == ["QubitUnitary"]
+        assert spy.call_count == 3
+
     def test_tensor_process_queuing(self):
         """Test that tensors are correctly queued"""
         with QuantumTape() as tape:
@@ -285,6 +359,44 @@ class TestConstruction:
             sample(qml.PauliZ(wires=0))
 
         assert tape.is_sampled
+        assert tape.copy().is_sampled
+        assert tape.expand().is_sampled
+
+    def test_measurements_on_wire(self):
+        """Test that the measurements acting on a wire are correctly returned"""
+        with QuantumTape() as tape:
+            qml.CNOT(wires=[0, "a"])
+            qml.RX(0.1, wires=4)
+            m1 = expval(qml.PauliZ(wires=0))
+            m2 = probs(wires=["a"])
+            m3 = expval(qml.PauliZ(wires=0) @ qml.PauliX(wires="a"))
+
+        assert np.all(tape._measurement_wires_mask == [1, 2, 3])
+        assert tape.measurements_on_wire(0) == [m1, m3]
+        assert tape.measurements_on_wire("a") == [m2, m3]
+        assert tape.measurements_on_wire(4) == []
+        assert tape.measurements_on_wire("b") == []
+
+        with QuantumTape() as tape:
+            qml.CNOT(wires=[0, "a"])
+            m1 = state()
+
+        assert tape.measurements_on_wire("a") == [m1]
+
+    def test_measurements_on_wire_many_wires(self):
+        """Test that the measurements acting on a wire are correctly returned
+        if the tape acts on more than 64 wires"""
+        with QuantumTape() as tape:
+            for i in range(70):
+                qml.Hadamard(wires=i)
+            m1 = expval(qml.PauliZ(wires=67))
+            m2 = probs(wires=[3, 67])
+            m3 = probs(wires=[5])
+
+        assert tape._measurement_wires_mask is None
+        assert tape.measurements_on_wire(67) == [m1, m2]
+        assert tape.measurements_on_wire(5) == [m3]
+        assert tape.measurements_on_wire(6) == []
 
 
 class TestGraph:
@@ -316,6 +428,39 @@ class TestGraph:
         assert g2 is g
         spy.assert_called_once()
 
+    def test_graph_cache(self, mocker):
+        """Test that the circuit graph is only reconstructed if
+        the circuit structure changes"""
+        with QuantumTape() as tape:
+            op1 = qml.RX(1.0, wires=0)
+            op2 = qml.CNOT(wires=[0, 1])
+            expval(qml.PauliZ(1))
+
+        g = tape.graph
+        spy = mocker.spy(NewCircuitGraph, "__init__")
+
+        # updating the tape metadata or parameters does not change the structure
+        tape._update()
+        tape.set_parameters([0.5])
+        assert tape.graph is g
+        spy.assert_not_called()
+
+        # inverting the tape changes the structure
+        tape.inv()
+        g_inv = tape.graph
+        assert g_inv is not g
+        assert g_inv.operations == [op2, op1]
+        spy.assert_called_once()
+
+        # inverting the tape again restores the original structure
+        tape.inv()
+        assert tape.graph is g
+        spy.assert_called_once()
+
+        # copies of the tape share the cached graphs
+        assert tape.copy().graph is g
+        spy.assert_called_once()
+
 
 class TestParameters:
     """Tests for parameter processing, setting, and manipulation"""
@@ -357,6 +502,25 @@ class TestParameters:
         assert tape.num_params == 4
         assert tape.get_parameters() == [params[i] for i in tape.trainable_params]
 
+    def test_trainable_params_order(self, make_tape):
+        """Test that trainable parameters are always returned and set in
+        order of appearance on the tape, independent of set iteration order"""
+        tape, params = make_tape
+        tape.trainable_params = {4, 1}
+
+        assert np.all(tape._trainable_mask == [False, True, False, False, True])
+        assert np.all(tape._trainable_idx == [1, 4])
+        assert tape.get_parameters() == [params[1], params[4]]
+
+        tape.set_parameters([0.1, 0.2])
+        assert tape.get_parameters(trainable_only=False) == [
+            params[0],
+            0.1,
+            params[2],
+            params[3],
+            0.2,
+        ]
+
     def test_changing_params(self, make_tape):
         """Test that changing trainable parameters works as expected"""
         tape, params = make_tape
@@ -381,6 +545,9 @@ class TestParameters:
         with pytest.raises(ValueError, match="has at most 5 parameters"):
             tape.trainable_params = {0, 7}
 
+        with pytest.raises(ValueError, match="has at most 5 parameters"):
+            tape.trainable_params = {5}
+
     def test_setting_parameters(self, make_tape):
         """Test that parameters are correctly modified after construction"""
         tape, params = make_tape
@@ -489,6 +656,25 @@ class TestParameters:
 
         assert np.all(obs.data[0] == H2)
 
+    def test_copy_operations(self):
+        """Test that setting the parameters of a tape copy with copied operations
+        does not modify the original tape"""
+        params = [0.1, 0.2, 0.3]
+
+        with QuantumTape() as tape:
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=1)
+            expval(qml.PauliZ(0) @ qml.Hermitian(np.diag([params[2], 1]), wires=1))
+
+        copied_tape = tape.copy(copy_operations=True)
+        assert copied_tape.get_parameters()[:2] == params[:2]
+        assert copied_tape.operations[0] is not tape.operations[0]
+        assert copied_tape.observables[0].obs[1] is not tape.observables[0].obs[1]
+
+        copied_tape.set_parameters([0.4, 0.5, np.eye(2)])
+        assert tape.get_parameters()[:2] == params[:2]
+        assert np.all(tape.get_parameters()[2] == np.diag([params[2], 1]))
+
 
 class TestInverse:
     """Tests for tape inversion"""
@@ -541,6 +727,51 @@ class TestInverse:
         assert tape.get_parameters() == [p[0], p[1]]
         assert tape._ops == ops
 
+    def test_parameter_info_transforms(self):
+        """Test that inversion correctly permutes the parameter information"""
+        p = [0.1, 0.2, 0.3, 0.4]
+
+        with QuantumTape() as tape:
+            ops = [qml.RX(p[0], wires=0), qml.Rot(*p[1:], wires=0), qml.CNOT(wires=[0, "a"])]
+            expval(qml.PauliZ(wires="a"))
+
+        tape._update_gradient_info()
+        grad_method = tape._par_grad_method.copy()
+        tape.inv()
+
+        assert tape._par_ops == [ops[1], ops[1], ops[1], ops[0]]
+        assert np.all(tape._par_p_idx == [0, 1, 2, 0])
+        assert np.all(tape._par_grad_method == grad_method[[1, 2, 3, 0]])
+
+    def test_inverse_involution(self):
+        """Test that inverting a tape twice restores the parameter information, and that
+        state preparation and observable parameters are not reordered"""
+        init_state = np.array([1, 1])
+        A = np.diag([1.0, -1.0])
+
+        with QuantumTape() as tape:
+            prep = qml.BasisState(init_state, wires=[0, "a"])
+            ops = [qml.Rot(0.1, 0.2, 0.3, wires=0), qml.CRX(0.4, wires=[0, "a"])]
+            ob = qml.Hermitian(A, wires="a")
+            expval(ob)
+
+        tape.trainable_params = {0, 2, 5}
+        par_ops = tape._par_ops.copy()
+        p_idx = tape._par_p_idx.copy()
+
+        tape.inv()
+        assert tape._par_ops == [prep, ops[1], ops[0], ops[0], ops[0], ob]
+        assert np.all(tape._par_p_idx == [0, 0, 0, 1, 2, 0])
+        assert tape.trainable_params == {0, 3, 5}
+        assert np.all(tape._trainable_mask == [True, False, False, True, False, True])
+        assert np.all(tape._trainable_idx == [0, 3, 5])
+
+        tape.inv()
+        assert tape._par_ops == par_ops
+        assert np.all(tape._par_p_idx == p_idx)
+        assert tape.trainable_params == {0, 2, 5}
+        assert tape._ops == ops
+
 
 class TestExpand:
     """Tests for tape expansion"""
@@ -617,6 +848,53 @@ class TestExpand:
         assert isinstance(new_tape.operations[0], qml.RX)
         assert isinstance(new_tape.operations[1], qml.RY)
 
+    def test_no_decomposition(self, mocker):
+        """Test that operations that do not define a decomposition
+        are not expanded"""
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.Rot(0.1, 0.2, 0.3, wires=0)
+            qml.CNOT(wires=[0, 1])
+
+        spy = mocker.spy(qml.operation.Operation, "expand")
+        new_tape = tape.expand()
+
+        assert spy.call_count == 1
+        assert spy.call_args[0][0] is tape.operations[1]
+        assert [op.name for op in new_tape.operations] == ["RX", "RZ", "RY", "RZ", "CNOT"]
+
+    def test_monkeypatching_once(self, mocker):
+        """Test that the operations are only monkeypatched once
+        when expanding several operations"""
+        with QuantumTape() as tape:
+            qml.PauliX(wires=0)
+            qml.Rot(0.1, 0.2, 0.3, wires=0)
+            qml.PauliY(wires=1)
+
+        queue = qml.operation.Operation.queue
+        spy = mocker.spy(qml.beta.tapes.tape, "mock_operations")
+        new_tape = tape.expand(depth=2)
+
+        assert spy.call_count == 1
+        assert len(new_tape.operations) == 9
+        assert qml.operation.Operation.queue is queue
+
+    def test_nothing_to_expand(self, mocker):
+        """Test that if no objects are to be expanded, the tape is copied
+        without monkeypatching the operations"""
+        with QuantumTape() as tape:
+            qml.PauliX(wires=0)
+            qml.Rot(0.1, 0.2, 0.3, wires=0)
+            probs(wires=0)
+
+        spy = mocker.spy(qml.beta.tapes.tape, "mock_operations")
+        new_tape = tape.expand(stop_at=lambda obj: obj.name in {"PauliX", "Rot"})
+
+        assert spy.call_count == 0
+        assert new_tape is not tape
+        assert new_tape.operations == tape.operations
+        assert new_tape.measurements == tape.measurements
+
     def test_nesting_and_decomposition(self):
         """Test an example that contains nested tapes and operation decompositions."""
 
@@ -664,6 +942,27 @@ class TestExpand:
         new_tape = tape.expand(depth=2)
         assert len(new_tape.operations) == 11
 
+    def test_depth_expansion_order(self, mocker):
+        """Test that expanding with depth=2 preserves the operation order,
+        without recursively expanding intermediate tapes"""
+        with QuantumTape() as tape:
+            qml.BasisState(np.array([1, 1]), wires=[0, "a"])
+
+            with QuantumTape() as tape2:
+                qml.Rot(0.543, 0.1, 0.4, wires=0)
+
+            qml.CNOT(wires=[0, "a"])
+            expval(qml.PauliZ(wires="a"))
+
+        spy = mocker.spy(qml.beta.tapes.tape, "expand_tape")
+        new_tape = tape.expand(depth=2)
+
+        assert spy.call_count == 1
+        expected = ["PhaseShift", "RX", "PhaseShift"] * 2 + ["RZ", "RY", "RZ", "CNOT"]
+        assert [op.name for op in new_tape.operations] == expected
+        assert new_tape.get_parameters() == [np.pi / 2, np.pi, np.pi / 2] * 2 + [0.543, 0.1, 0.4]
+        assert new_tape.measurements == tape.measurements
+
     def test_stopping_criterion_with_depth(self):
         """Test that gates specified in the stop_at
         argument are not expanded."""
@@ -709,9 +1008,126 @@ class TestExpand:
         assert [m.eigvals is r for m, r in zip(new_tape.measurements, expected)]
 
 
+def make_hash_tape(x=0.432, A=None, inverse=False, return_type=expval, wires=(0, "a")):
+    """Creates a tape for testing the tape hash"""
+    A = np.diag([1.0, 2.0]) if A is None else A
+
+    with QuantumTape() as tape:
+        qml.BasisState(np.array([1, 0]), wires=wires)
+        op = qml.RX(x, wires=wires[0])
+
+        if inverse:
+            op.inv()
+
+        qml.CNOT(wires=wires)
+        return_type(qml.PauliZ(wires[0]) @ qml.Hermitian(A, wires=wires[1]))
+        probs(wires=wires[1])
+
+    return tape
+
+
+class TestHash:
+    """Tests for the tape hash"""
+
+    def test_same_circuit(self):
+        """Test that tapes representing the same circuit have the same hash"""
+        tape = make_hash_tape()
+        assert isinstance(tape.hash, int)
+        assert tape.hash == make_hash_tape().hash
+        assert tape.hash == tape.copy().hash
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"x": 0.1},
+            {"A": np.diag([1.0, 3.0])},
+            {"A": np.diag([1, 2])},
+            {"inverse": True},
+            {"return_type": var},
+            {"wires": (1, "a")},
+        ],
+    )
+    def test_different_circuit(self, kwargs):
+        """Test that tapes representing different circuits have different hashes"""
+        assert make_hash_tape().hash != make_hash_tape(**kwargs).hash
+
+    def test_parameters_changed(self):
+        """Test that the hash is updated when the tape parameters change"""
+        tape = make_hash_tape()
+        tape.trainable_params = {1}
+        h = tape.hash
+
+        tape.set_parameters([0.1])
+        assert tape.hash != h
+
+        tape.set_parameters([0.432])
+        assert tape.hash == h
+
+    def test_nested_tape(self):
+        """Test that nested tapes contribute to the hash"""
+        with QuantumTape() as tape1:
+            with QuantumTape():
+                qml.RX(0.1, wires=0)
+
+        with QuantumTape() as tape2:
+            with QuantumTape():
+                qml.RX(0.2, wires=0)
+
+        assert tape1.hash != tape2.hash
+        assert tape1.hash == tape1.copy().hash
+
+    def test_unconvertible_parameters(self):
+        """Test that tapes with parameters that cannot be converted to a double
+        or a numeric array have no hash"""
+
+        class Unconvertible:
+            """Parameter raising an error on array conversion"""
+
+            def __array__(self, dtype=None):
+                raise RuntimeError("cannot convert")
+
+        assert make_hash_tape(x=10 ** 400).hash is None
+        assert make_hash_tape(x=Unconvertible()).hash is None
+        assert make_hash_tape(x=object()).hash is None
+
+    def test_unexpected_conversion_error(self):
+        """Test that unexpected errors raised when converting a parameter
+        are not suppressed"""
+
+        class Faulty:
+            """Parameter raising an unexpected error on array conversion"""
+
+            def __array__(self, dtype=None):
+                raise KeyError("faulty")
+
+        with pytest.raises(KeyError, match="faulty"):
+            make_hash_tape(x=Faulty()).hash  # pylint: disable=expression-not-assigned
+
+
 class TestExecution:
     """Tests for tape execution"""
 
+    @pytest.mark.parametrize("caching", [0, 10])
+    def test_circuit_hash_if_required(self, caching, mocker):
+        """Test that the circuit is only hashed during execution if the
+        execution is cached"""
+        hash_spy = mocker.spy(tape_module, "_parameter_hash")
+        dev = qml.device("default.qubit", wires=1)
+
+        with QuantumTape(caching=caching) as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        tape.jacobian_options = {"method": "analytic"}
+        tape.execute(dev)
+
+        if caching:
+            assert hash_spy.call_count == 1
+            assert dev.circuit_hash == tape.hash
+        else:
+            assert hash_spy.call_count == 0
+            assert dev.circuit_hash is None
+
     def test_execute_parameters(self, tol):
         """Test execution works when parameters are both passed and not passed."""
         dev = qml.device("default.qubit", wires=2)
@@ -956,10 +1372,10 @@ class TestExecution:
 class TestCVExecution:
     """Tests for CV tape execution"""
 
-    def test_single_output_value(self, tol):
+    def test_single_output_value(self, gaussian2_dev, tol):
         """Tests correct execution and output shape for a CV tape
         with a single expval output"""
-        dev = qml.device("default.gaussian", wires=2)
+        dev = gaussian2_dev
         x = 0.543
         y = -0.654
 
@@ -974,10 +1390,10 @@ class TestCVExecution:
         res = tape.execute(dev)
         assert res.shape == (1,)
 
-    def test_multiple_output_values(self, tol):
+    def test_multiple_output_values(self, gaussian2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with multiple measurement types"""
-        dev = qml.device("default.gaussian", wires=2)
+        dev = gaussian2_dev
         x = 0.543
         y = -0.654
 
@@ -1036,6 +1452,67 @@ class TestGradMethod:
         assert tape._par_info[0]["grad_method"] == "F"
         assert tape._par_info[1]["grad_method"] == "0"
 
+    def test_gradient_info_reused(self, mocker):
+        """Test that gradient methods are only computed for parameters
+        that have not previously been trainable"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            expval(qml.PauliZ(1))
+
+        spy = mocker.spy(tape, "_grad_method")
+
+        tape.trainable_params = {0}
+        tape.jacobian(dev)
+        tape.jacobian(dev)
+        assert [c[0][0] for c in spy.call_args_list] == [0]
+
+        tape.trainable_params = {0, 1}
+        res = tape.jacobian(dev)
+        assert [c[0][0] for c in spy.call_args_list] == [0, 1]
+        assert res.shape == (1, 2)
+
+    def test_dependent_short_circuit(self, mocker):
+        """Test that the observables are only searched until the
+        parameter is found to affect one of them"""
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.CNOT(wires=[0, 2])
+            qml.RY(-0.654, wires=[1])
+            qml.CNOT(wires=[1, 2])
+            expval(qml.PauliY(2))
+            expval(qml.PauliZ(2))
+            expval(qml.PauliX(3))
+
+        spy = mocker.spy(tape.graph, "has_path")
+        assert tape._grad_method(0) == "F"
+        assert spy.call_count == 1
+
+        assert tape._grad_method(1) == "F"
+        assert spy.call_count == 2
+
+    def test_shared_wire_skips_graph(self, mocker):
+        """Test that the circuit graph is not constructed if every trainable
+        operation acts on a wire of one of the observables"""
+        spy = mocker.spy(NewCircuitGraph, "__init__")
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            qml.RY(-0.654, wires=[1])
+            expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tape._update_gradient_info()
+
+        assert tape._par_info[0]["grad_method"] == "F"
+        assert tape._par_info[1]["grad_method"] == "F"
+        assert tape._graph is None
+        spy.assert_not_called()
+
         # in non-graph mode, it is impossible to determine
         # if a parameter is independent or not
         tape._graph = None
@@ -1208,11 +1685,49 @@ class TestJacobian:
         assert len(numeric_spy.call_args_list) == 1
 
         # analytic pd should not be called at all
-        assert len(analytic_spy.call_args_list) == 0
+        analytic_spy.assert_not_called()
 
         # the numeric pd method is only called for parameter 0
         assert numeric_spy.call_args[0] == (tape, 0, dev)
 
+        # the column of the independent parameter is zero
+        assert np.all(res[:, 1] == 0)
+
+    def test_shifted_output_option_ignored(self):
+        """Test that a shifted output passed to the Jacobian is ignored,
+        since it cannot apply to every parameter"""
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        expected = tape.jacobian(dev, method="numeric")
+
+        res = tape.jacobian(dev, method="numeric", y=None)
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+        res = tape.jacobian(dev, method="numeric", y=np.array([0.0]))
+        assert np.allclose(res, expected, atol=1e-8, rtol=0)
+
+    def test_all_independent_parameters(self, count_calls):
+        """Test that if all parameters are independent, the device is
+        not executed and the returned Jacobian is zero"""
+        execute_counter = count_calls(QuantumTape, "execute_device")
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[1])
+            expval(qml.PauliZ(2))
+            probs(wires=[2, 3])
+
+        dev = qml.device("default.qubit", wires=4)
+        res = tape.jacobian(dev)
+
+        assert res.shape == (5, 2)
+        assert np.all(res == 0)
+        assert execute_counter.call_count == 0
+
     def test_no_trainable_parameters(self, mocker):
         """Test that if the tape has no trainable parameters, no
         subroutines are called and the returned Jacobian is empty"""
@@ -1255,6 +1770,243 @@ class TestJacobian:
         assert "y0" in numeric_spy.call_args_list[0][1]
         assert "y0" in numeric_spy.call_args_list[1][1]
 
+    def test_y0_reused_after_execution(self, count_calls, tol):
+        """Test that the result of executing the tape is reused as the unshifted
+        result by a subsequent Jacobian computation at the same parameters"""
+        execute_counter = count_calls(QuantumTape, "execute_device")
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        tape.execute(dev)
+        execute_counter.reset()
+
+        res = tape.jacobian(dev)
+        assert execute_counter.call_count == tape.num_params
+
+        expected = [[-np.sin(0.543) * np.cos(-0.654), -np.cos(0.543) * np.sin(-0.654)]]
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+        # the result cannot be reused for different parameters
+        execute_counter.reset()
+        tape.jacobian(dev, params=[0.1, 0.2])
+        assert execute_counter.call_count == tape.num_params + 1
+
+        # or for a different device
+        execute_counter.reset()
+        tape.jacobian(qml.device("default.qubit", wires=1))
+        assert execute_counter.call_count == tape.num_params + 1
+
+    @pytest.mark.parametrize(
+        "options,recorded",
+        [
+            ({}, True),
+            ({"method": "numeric"}, True),
+            ({"method": "numeric", "order": 2}, False),
+            ({"method": "analytic"}, False),
+            ({"method": "device"}, False),
+        ],
+    )
+    def test_execution_recorded_if_required(self, options, recorded, mocker):
+        """Test that the result of executing the tape is only recorded, and the
+        tape hashed, if the Jacobian options make use of the unshifted result"""
+        hash_spy = mocker.spy(tape_module, "_parameter_hash")
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        tape.jacobian_options = options
+        dev = qml.device("default.qubit", wires=1)
+        tape.execute(dev)
+
+        assert (tape._last_execution is not None) is recorded
+        assert hash_spy.call_count == int(recorded)
+
+    def test_execution_recorded_with_caching(self, mocker):
+        """Test that the circuit hash is reused if the result is both
+        cached and recorded"""
+        hash_spy = mocker.spy(tape_module, "_parameter_hash")
+
+        with QuantumTape(caching=10) as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        tape.execute(dev)
+
+        assert tape._last_execution is not None
+
+        # the circuit is only hashed by the tape cache
+        assert hash_spy.call_count == 1
+
+    def test_execution_not_recorded_if_unhashable(self, mocker):
+        """Test that the result of executing a tape that cannot be hashed
+        is not recorded"""
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        tape.execute(dev)
+        assert tape._last_execution is not None
+
+        mocker.patch.object(QuantumTape, "hash", new_callable=mocker.PropertyMock, return_value=None)
+        tape.execute(dev)
+        assert tape._last_execution is None
+
+    def test_batched_shifts(self, mocker, tol):
+        """Test that if first order finite differences is used, the unshifted and
+        shifted parameters are submitted for execution as a single batch"""
+        batch_spy = mocker.spy(QuantumTape, "batch_execute_device")
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[0])
+            qml.RY(0.1, wires=[1])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=2)
+        res = tape.jacobian(dev, h=1e-3)
+
+        # the parameter with zero gradient is not shifted
+        assert batch_spy.call_count == 1
+        shifted = batch_spy.call_args[0][1]
+        expected = [[0.543, -0.654, 0.1], [0.544, -0.654, 0.1], [0.543, -0.653, 0.1]]
+        assert np.allclose(shifted, expected, atol=tol, rtol=0)
+
+        expected = tape.jacobian(dev, h=1e-3, order=2)
+        assert np.allclose(res, expected, atol=1e-3, rtol=0)
+
+    def test_batched_central_shifts(self, mocker, tol):
+        """Test that if second order finite differences is used, the forward and
+        backward shifted parameters are submitted for execution as a single batch"""
+        batch_spy = mocker.spy(QuantumTape, "batch_execute_device")
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        res = tape.numeric_pd(0, dev, h=1e-3, order=2)
+
+        assert batch_spy.call_count == 1
+        shifted = batch_spy.call_args[0][1]
+        assert np.allclose(shifted, [[0.5435], [0.5425]], atol=tol, rtol=0)
+        assert np.allclose(res, -np.sin(0.543), atol=1e-6, rtol=0)
+
+    def test_parallel_shifts(self, tol):
+        """Test that executing the shifted tapes using a thread pool gives the same
+        result as sequential execution, and leaves the tape unmodified"""
+        params = [0.543, -0.654, 0.1]
+
+        with QuantumTape() as tape:
+            qml.RX(params[0], wires=[0])
+            qml.RY(params[1], wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.RZ(params[2], wires=[1])
+            expval(qml.PauliZ(0) @ qml.PauliX(1))
+            probs(wires=[0, 1])
+
+        dev = qml.device("default.qubit", wires=2)
+        res = tape.jacobian(dev, parallel="thread")
+        expected = tape.jacobian(dev)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert tape.get_parameters() == params
+
+        with pytest.raises(ValueError, match="Unknown parallel execution mode"):
+            tape.jacobian(dev, parallel="process")
+
+    def test_parallel_autograd_device(self, tol):
+        """Test that executing the shifted tapes using a thread pool on the
+        autograd passthru device gives the same result as sequential execution"""
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.RZ(0.1, wires=[1])
+            expval(qml.PauliZ(0) @ qml.PauliX(1))
+            expval(qml.PauliY(1))
+
+        dev = qml.device("default.qubit.autograd", wires=2)
+        res = tape.jacobian(dev, method="numeric", order=2, parallel="thread")
+        expected = tape.jacobian(dev, method="numeric", order=2)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_parallel_unsupported_device(self, monkeypatch):
+        """Test that an exception is raised if parallel execution is requested
+        for a device that does not support concurrent execution of its copies"""
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        capabilities = dev.capabilities().copy()
+        del capabilities["supports_parallel_copies"]
+        monkeypatch.setattr(dev, "capabilities", lambda: capabilities)
+
+        with pytest.raises(ValueError, match="does not support parallel execution"):
+            tape.jacobian(dev, parallel="thread")
+
+    def test_parallel_tape_copies(self, mocker):
+        """Test that when executing using a thread pool, each worker thread
+        copies the tape once, and reuses the copy for subsequent executions"""
+        threads = set()
+        tape_copy = QuantumTape.copy
+
+        def copy_spy(tape, *args, **kwargs):
+            threads.add(threading.get_ident())
+            return tape_copy(tape, *args, **kwargs)
+
+        spy = mocker.patch.object(QuantumTape, "copy", autospec=True, side_effect=copy_spy)
+
+        with QuantumTape() as tape:
+            qml.RX(0.543, wires=[0])
+            expval(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        params = np.linspace(0, 1, 20)[:, None]
+        res = tape.batch_execute_device(params, dev, parallel="thread")
+
+        assert spy.call_count == len(threads)
+        assert np.allclose(np.ravel(res), np.cos(params.flatten()))
+
+    def test_parallel_pool_shared(self, mocker, tol):
+        """Test that a single thread pool, and a single copy of the tape per worker
+        thread, are shared between all batches executed during a Jacobian computation"""
+        threads = set()
+        tape_copy = QuantumTape.copy
+
+        def copy_spy(tape, *args, **kwargs):
+            threads.add(threading.get_ident())
+            return tape_copy(tape, *args, **kwargs)
+
+        pool_spy = mocker.spy(concurrent.futures.ThreadPoolExecutor, "__init__")
+
+        with QuantumTape() as tape:
+            for i in range(4):
+                qml.RX(0.1 * (i + 1), wires=[i])
+            expval(qml.PauliZ(0) @ qml.PauliZ(1) @ qml.PauliZ(2) @ qml.PauliZ(3))
+
+        dev = qml.device("default.qubit", wires=4)
+        expected = tape.jacobian(dev, order=2)
+
+        copy_spy = mocker.patch.object(QuantumTape, "copy", autospec=True, side_effect=copy_spy)
+        batch_spy = mocker.spy(QuantumTape, "batch_execute_device")
+        res = tape.jacobian(dev, order=2, parallel="thread")
+
+        # second order finite differences execute one batch per parameter
+        assert batch_spy.call_count == 4
+        assert pool_spy.call_count == 1
+        assert copy_spy.call_count == len(threads)
+        assert tape._parallel_execution is None
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
     def test_parameters(self, tol):
         """Test Jacobian computation works when parameters are both passed and not passed."""
         dev = qml.device("default.qubit", wires=2)
@@ -1281,10 +2033,10 @@ class TestJacobian:
         assert not np.allclose(res1, res2, atol=tol, rtol=0)
         assert tape.get_parameters() == [0.5, 0.6]
 
-    def test_numeric_pd_no_y0(self, mocker, tol):
+    def test_numeric_pd_no_y0(self, count_calls, tol):
         """Test that, if y0 is not passed when calling the numeric_pd method,
         y0 is calculated."""
-        execute_spy = mocker.spy(QuantumTape, "execute_device")
+        execute_counter = count_calls(QuantumTape, "execute_device")
 
         dev = qml.device("default.qubit", wires=2)
         params = [0.1, 0.2]
@@ -1297,13 +2049,13 @@ class TestJacobian:
 
         # compute numeric gradient of parameter 0, without passing y0
         res1 = tape.numeric_pd(0, dev)
-        assert len(execute_spy.call_args_list) == 2
+        assert execute_counter.call_count == 2
 
         # compute y0 in advance
         y0 = tape.execute(dev)
-        execute_spy.call_args_list = []
+        execute_counter.reset()
         res2 = tape.numeric_pd(0, dev, y0=y0)
-        assert len(execute_spy.call_args_list) == 1
+        assert execute_counter.call_count == 1
         assert np.allclose(res1, res2, atol=tol, rtol=0)
 
     def test_numeric_unknown_order(self):
@@ -1326,10 +2078,10 @@ class TestJacobian:
 class TestJacobianIntegration:
     """Integration tests for the Jacobian method"""
 
-    def test_ragged_output(self):
+    def test_ragged_output(self, qubit3_dev):
         """Test that the Jacobian is correctly returned for a tape
         with ragged output"""
-        dev = qml.device("default.qubit", wires=3)
+        dev = qubit3_dev
         params = [1.0, 1.0, 1.0]
 
         with QuantumTape() as tape:
@@ -1343,10 +2095,34 @@ class TestJacobianIntegration:
         res = tape.jacobian(dev)
         assert res.shape == (6, 3)
 
-    def test_single_expectation_value(self, tol):
+    def test_ragged_output_values(self, qubit3_dev, tol):
+        """Test that each ragged measurement result is written to the correct
+        rows of the Jacobian"""
+        dev = qubit3_dev
+        params = [1.0, 0.5, 0.3]
+
+        def circuit(*measurements):
+            with QuantumTape() as tape:
+                qml.RX(params[0], wires=[0])
+                qml.RY(params[1], wires=[1])
+                qml.RX(params[2], wires=[2])
+                qml.CNOT(wires=[0, 1])
+
+                for m, wires in measurements:
+                    m(wires=wires)
+
+            return tape
+
+        res = circuit((probs, 0), (probs, [1, 2])).jacobian(dev)
+        expected = np.vstack(
+            [circuit((probs, 0)).jacobian(dev), circuit((probs, [1, 2])).jacobian(dev)]
+        )
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_single_expectation_value(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with a single expval output"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -1362,10 +2138,10 @@ class TestJacobianIntegration:
         expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_multiple_expectation_values(self, tol):
+    def test_multiple_expectation_values(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with multiple expval outputs"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -1382,10 +2158,10 @@ class TestJacobianIntegration:
         expected = np.array([[-np.sin(x), 0], [0, np.cos(y)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_var_expectation_values(self, tol):
+    def test_var_expectation_values(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with expval and var outputs"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -1402,10 +2178,10 @@ class TestJacobianIntegration:
         expected = np.array([[-np.sin(x), 0], [0, -2 * np.cos(y) * np.sin(y)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_prob_expectation_values(self, tol):
+    def test_prob_expectation_values(self, qubit2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with prob and expval outputs"""
-        dev = qml.device("default.qubit", wires=2)
+        dev = qubit2_dev
         x = 0.543
         y = -0.654
 
@@ -1450,10 +2226,10 @@ class TestJacobianIntegration:
 class TestJacobianCVIntegration:
     """Intgration tests for the Jacobian method and CV circuits"""
 
-    def test_single_output_value(self, tol):
+    def test_single_output_value(self, gaussian2_dev, tol):
         """Tests correct Jacobian and output shape for a CV tape
         with a single output"""
-        dev = qml.device("default.gaussian", wires=2)
+        dev = gaussian2_dev
         n = 0.543
         a = -0.654
 
@@ -1469,10 +2245,10 @@ class TestJacobianCVIntegration:
         expected = np.array([2 * a ** 2 + 2 * n + 1, 2 * a * (2 * n + 1)])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_multiple_output_values(self, tol):
+    def test_multiple_output_values(self, gaussian2_dev, tol):
         """Tests correct output shape and evaluation for a tape
         with multiple outputs"""
-        dev = qml.device("default.gaussian", wires=2)
+        dev = gaussian2_dev
         n = 0.543
         a = -0.654
 
@@ -1489,9 +2265,9 @@ class TestJacobianCVIntegration:
         expected = np.array([[1, 2 * a], [2 * a ** 2 + 2 * n + 1, 2 * a * (2 * n + 1)]])
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
-    def test_trainable_measurement(self, tol):
+    def test_trainable_measurement(self, gaussian2_dev, tol):
         """Test that a trainable measurement can be differentiated"""
-        dev = qml.device("default.gaussian", wires=2)
+        dev = gaussian2_dev
         a = 0.32
         phi = 0.54
 
@@ -397,6 +397,32 @@ class TestDefaultGaussianDevice:
             assert gaussian_dev._state[0] == pytest.approx(expected_out[0], abs=tol)
             assert gaussian_dev._state[1] == pytest.approx(expected_out[1], abs=tol)
 
+    def test_apply_gate_sequence(self, gaussian_dev, tol):
+        """Test that applying a sequence of gates, interleaved with displacements,
+        results in the same state as applying each symplectic matrix in turn"""
+        gaussian_dev.reset()
+        gaussian_dev.apply('SqueezedState', wires=Wires([0]), par=[0.652, -0.124])
+
+        mu, cov = gaussian_dev._state
+        gates = [('Squeezing', [0], [0.2, 0.3]), ('Beamsplitter', [0, 1], [0.4, 0.1]),
+                 ('Rotation', [1], [0.7]), ('Displacement', [0], [0.3, 0.2]),
+                 ('TwoModeSqueezing', [1, 0], [0.1, 0.5]), ('Rotation', [0], [0.2])]
+
+        for gate_name, w, p in gates:
+            gaussian_dev.apply(gate_name, wires=Wires(w), par=p)
+
+            if gate_name == 'Displacement':
+                alpha = p[0] * np.exp(1j * p[1])
+                mu = mu.copy()
+                mu[w[0]] += alpha.real * np.sqrt(2 * hbar)
+                mu[w[0] + 2] += alpha.imag * np.sqrt(2 * hbar)
+            else:
+                S = gaussian_dev.expand(gaussian_dev._operation_map[gate_name](*p), Wires(w))
+                mu, cov = S @ mu, S @ cov @ S.T
+
+        assert gaussian_dev._state[0] == pytest.approx(mu, abs=tol)
+        assert gaussian_dev._state[1] == pytest.approx(cov, abs=tol)
+
     def test_apply_errors(self, gaussian_dev):
         """Test that apply fails for incorrect state preparation"""
 
@@ -611,6 +637,7 @@ class TestDefaultGaussianIntegration:
                         "returns_state": False,
                         "supports_reversible_diff": False,
                         "supports_analytic_computation": True,
+                        "supports_parallel_copies": True,
                         }
         assert cap == capabilities
 
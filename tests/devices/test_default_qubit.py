@@ -428,6 +428,40 @@ class TestApply:
                 qml.BasisState(np.array([1, 1]), wires=[0, 1])
             ])
 
+    def test_apply_single_qubit_pairs(self, qubit_device_3_wires, mocker, tol):
+        """Test that consecutive single-qubit operations on different wires are
+        applied in pairs, and that the resulting state is correct"""
+        spy = mocker.spy(qubit_device_3_wires, "_apply_unitary_pair")
+
+        ops = [
+            qml.RX(0.1, wires=[0]),
+            qml.RY(0.2, wires=[2]),
+            qml.Rot(0.3, 0.4, 0.5, wires=[1]),
+            qml.RX(0.6, wires=[1]),
+            qml.RY(0.9, wires=[0]),
+            qml.Hadamard(wires=[2]),
+            qml.CNOT(wires=[0, 1]),
+            qml.RY(0.7, wires=[1]).inv(),
+            qml.RX(0.8, wires=[0]),
+        ]
+
+        qubit_device_3_wires.reset()
+        qubit_device_3_wires.apply(ops)
+
+        # (RX, RY), (RX, RY), and (RY.inv, RX) are applied as pairs; the Rot
+        # acts on the same wire as the following RX, and Hadamard is applied directly
+        assert spy.call_count == 3
+
+        expected = np.zeros(8, dtype=complex)
+        expected[0] = 1
+
+        for op in ops:
+            U = np.kron(np.eye(2 ** op.wires[0].labels[0]), op.matrix)
+            U = np.kron(U, np.eye(2 ** (3 - len(op.wires) - op.wires[0].labels[0])))
+            expected = U @ expected
+
+        assert np.allclose(qubit_device_3_wires.state, expected, atol=tol, rtol=0)
+
 class TestExpval:
     """Tests that expectation values are properly calculated or that the proper errors are raised."""
 
@@ -683,6 +717,7 @@ class TestDefaultQubitIntegration:
                         "supports_reversible_diff": True,
                         "supports_inverse_operations": True,
                         "supports_analytic_computation": True,
+                        "supports_parallel_copies": True,
                         }
         assert cap == capabilities
 
@@ -37,6 +37,7 @@ class TestQNodeIntegration:
                         "supports_reversible_diff": False,
                         "supports_inverse_operations": True,
                         "supports_analytic_computation": True,
+                        "supports_parallel_copies": True,
                         "passthru_interface": 'autograd',
                         }
         assert cap == capabilities
@@ -805,6 +805,7 @@ class TestQNodeIntegration:
                         "supports_reversible_diff": False,
                         "supports_inverse_operations": True,
                         "supports_analytic_computation": True,
+                        "supports_parallel_copies": False,
                         "passthru_interface": 'tf',
                         }
         assert cap == capabilities
@@ -100,6 +100,32 @@ class TestObservables:
         res = obs.matrix
         assert np.allclose(res, mat, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("obs", [qml.PauliX, qml.PauliY, qml.PauliZ])
+    @pytest.mark.parametrize("wires", [0, "a", [0], ("a",)])
+    def test_pauli_wires_shared(self, obs, wires):
+        """Test that Pauli observables on the same wire share their Wires object,
+        but are distinct operators"""
+        ob1 = obs(wires=wires)
+        ob2 = obs(wires)
+
+        assert ob1 is not ob2
+        assert ob1.wires is ob2.wires
+        assert ob1.wires == Wires(wires)
+
+        ob1.inv()
+        assert ob1.inverse
+        assert not ob2.inverse
+
+    def test_pauli_wires_not_shared(self):
+        """Test that Pauli observables specified by non-label wires are constructed as usual"""
+        ob1 = qml.PauliZ(wires=Wires(1))
+        ob2 = qml.PauliZ(wires=np.array(1))
+
+        assert ob1.wires == ob2.wires == Wires(1)
+
+        with pytest.raises(ValueError, match="wrong number of wires"):
+            qml.PauliZ(wires=[0, 1])
+
     @pytest.mark.parametrize("observable, eigvals, eigvecs", EIGVALS_TEST_DATA)
     def test_hermitian_eigegendecomposition_single_wire(self, observable, eigvals, eigvecs, tol):
         """Tests that the eigendecomposition property of the Hermitian class returns the correct results
@@ -292,6 +318,19 @@ class TestObservables:
         # verify equivalent to input state
         assert np.allclose(out, H, atol=tol, rtol=0)
 
+    def test_hermitian_eigvals_validated_once(self, mocker):
+        """Test that the Hermitian matrix is only validated the first time
+        its eigendecomposition is computed"""
+        H = np.array([[1, 2], [2, 4]])
+        obs = qml.Hermitian(H, wires=0)
+        spy = mocker.spy(qml.Hermitian, "_matrix")
+
+        w1 = obs.eigvals
+        w2 = qml.Hermitian(H.copy(), wires=1).eigvals
+
+        assert w1 is w2
+        assert spy.call_count == 1
+
     def test_hermitian_exceptions(self):
         """Tests that the hermitian matrix method raises the proper errors."""
         H = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
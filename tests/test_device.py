@@ -19,7 +19,7 @@ import pytest
 import pennylane as qml
 from pennylane import Device, DeviceError
 from pennylane.qnodes import QuantumFunctionError
-from pennylane.wires import Wires
+from pennylane.wires import Wires, WireError
 from collections import OrderedDict
 
 mock_device_paulis = ["PauliX", "PauliY", "PauliZ"]
@@ -424,6 +424,18 @@ class TestInternalFunctions:
                                 (Wires(-1), Wires(2)), (Wires(3), Wires(3))])
         assert dev.wire_map == expected
 
+    def test_map_wires_caching(self, mock_device):
+        """Tests that mapped wires are cached, and that unknown wires are not."""
+        dev = mock_device(wires=['a1', 'q', -1, 3])
+
+        mapped = dev.map_wires(Wires(['q', 3]))
+        assert mapped == Wires([1, 3])
+        assert dev.map_wires(Wires(['q', 3])) is mapped
+
+        for _ in range(2):
+            with pytest.raises(WireError, match="Did not find some of the wires"):
+                dev.map_wires(Wires(['b']))
+
 
 class TestClassmethods:
     """Test the classmethods of Device"""
@@ -1156,6 +1156,13 @@ class TestTensorObservableOperations:
 class TestDecomposition:
     """Test for operation decomposition"""
 
+    def test_has_decomposition(self):
+        """Test that operations report whether they define a decomposition"""
+        assert qml.Rot.has_decomposition
+        assert qml.U1(0.1, wires=0).has_decomposition
+        assert not qml.RX.has_decomposition
+        assert not qml.CNOT(wires=[0, 1]).has_decomposition
+
     def test_U1_decomposition(self):
         """Test the decomposition of the U1 gate provides the equivalent phase shift gate"""
         phi = 0.432
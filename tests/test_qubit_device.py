@@ -239,6 +239,26 @@ class TestOperations:
         len(call_history.items()) == 1
         call_history["hash"] = circuit_graph.hash
 
+    def test_circuit_hash_keyword_argument(self, mock_qubit_device_with_paulis_rotations_and_methods,
+                                           monkeypatch):
+        """Tests that a circuit hash passed to execute is stored by the device
+        instead of the hash of the circuit, and is not propagated to apply()"""
+        queue = [qml.RX(0.3, wires=[0])]
+        circuit_graph = CircuitGraph(queue + [qml.PauliZ(0)], {}, Wires([0, 1, 2]))
+
+        call_history = {}
+
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "apply", lambda self, x, **kwargs: call_history.update(kwargs))
+            dev = mock_qubit_device_with_paulis_rotations_and_methods()
+
+            dev.execute(circuit_graph, circuit_hash=None)
+            assert dev.circuit_hash is None
+            assert "circuit_hash" not in call_history
+
+            dev.execute(circuit_graph)
+            assert dev.circuit_hash == circuit_graph.hash
+
 
 class TestObservables:
     """Tests the logic related to observables"""